@@ -0,0 +1,70 @@
+"""Move raw LinkedIn payloads into side tables
+
+Creates employee_raw and company_linkedin_raw, copies the existing raw_data
+of employees and company_linkedin_profiles into them, then drops the old
+columns. Databases created after the move (no raw_data column on the hot
+tables) are left untouched.
+
+Revision ID: 0001_move_raw_payloads
+Revises:
+Create Date: 2026-10-15 00:00:00
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+# revision identifiers
+revision: str = "0001_move_raw_payloads"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (hot table, side table, side table key column)
+_MOVES = (
+    ("employees", "employee_raw", "employee_id"),
+    ("company_linkedin_profiles", "company_linkedin_raw", "company_linkedin_id"),
+)
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return False
+    return any(c["name"] == column for c in inspector.get_columns(table))
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, raw_table, key in _MOVES:
+        if not _has_column(table, "raw_data"):
+            continue
+        if not inspector.has_table(raw_table):
+            op.create_table(
+                raw_table,
+                sa.Column(
+                    key,
+                    UUID(as_uuid=True),
+                    sa.ForeignKey(f"{table}.id", ondelete="CASCADE"),
+                    primary_key=True,
+                ),
+                sa.Column("raw_data", JSONB, nullable=True),
+            )
+        op.execute(
+            f"INSERT INTO {raw_table} ({key}, raw_data) "
+            f"SELECT id, raw_data::jsonb FROM {table} WHERE raw_data IS NOT NULL "
+            f"ON CONFLICT ({key}) DO NOTHING"
+        )
+        op.drop_column(table, "raw_data")
+
+
+def downgrade() -> None:
+    for table, raw_table, key in _MOVES:
+        if _has_column(table, "raw_data"):
+            continue
+        op.add_column(table, sa.Column("raw_data", JSONB, nullable=True))
+        op.execute(
+            f"UPDATE {table} SET raw_data = r.raw_data "
+            f"FROM {raw_table} r WHERE r.{key} = {table}.id"
+        )
+        op.drop_table(raw_table)
@@ -3,17 +3,31 @@ API Routes
 
 REST endpoints for the Zavis LinkedIn Marketing Tool.
 Maps HTTP operations to ontology Actions.
+
+Every route is `async def` and runs on the event loop, so it may only await
+truly asynchronous calls. Blocking work (gspread, Celery dispatch, file I/O)
+goes through asyncio.to_thread or an async library.
 """
 
+import asyncio
+import os
+import tempfile
 import uuid
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+import aiofiles
+from fastapi import (
+    APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response,
+    UploadFile, File, Form,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, delete, func, select, tuple_
+from sqlalchemy.orm import selectinload, raiseload
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, async_session
 from app.models.ontology import (
     LinkedInAccount, DataSource, Company, CompanyLinkedIn,
     Employee, MatchResult, ScraperJob, Schedule,
@@ -24,7 +38,7 @@ from app.schemas.schemas import (
     DataSourceCreate, DataSourceResponse,
     CompanyResponse, EmployeeResponse,
     ScraperJobCreate, ScraperJobResponse, ScraperJobLaunchResponse,
-    JobSummary, RoleMatchRequest, RoleMatchSuggestion,
+    JobCounts, JobSummary, RoleMatchRequest, RoleMatchSuggestion,
 )
 from app.services import job_orchestrator
 from app.services.ai_matcher import suggest_related_roles
@@ -32,6 +46,89 @@ from app.services.google_sheets import get_sheet_tabs, get_sheet_columns
 
 router = APIRouter()
 
+# Rows fetched per round-trip when streaming large result sets
+STREAM_BATCH_SIZE = 1000
+
+# Bytes read from an upload per await; bounds memory for large CSVs
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Validate and serialize whole result lists in one call rather than one model
+# per row. Routes return the JSON bytes directly, so FastAPI doesn't validate
+# the list a second time against response_model (kept for the schema docs).
+_COMPANY_LIST_ADAPTER = TypeAdapter(List[CompanyResponse])
+_EMPLOYEE_LIST_ADAPTER = TypeAdapter(List[EmployeeResponse])
+
+
+def _json_list(adapter: TypeAdapter, rows: List[dict]) -> Response:
+    """Validate rows with a list adapter and return them as a JSON response."""
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(rows)),
+        media_type="application/json",
+    )
+
+
+def _keyset_statements(stmt, model):
+    """
+    Prebuild the newest-first page query for a list endpoint.
+
+    Returns (first_page, after_cursor). Limit and cursor values are bound
+    parameters, so every request reuses the same compiled statement.
+    """
+    first_page = (
+        stmt.order_by(model.created_at.desc(), model.id.desc())
+        .limit(bindparam("limit"))
+    )
+    after_cursor = first_page.where(
+        tuple_(model.created_at, model.id) < tuple_(
+            bindparam("cursor_created_at", type_=model.created_at.type),
+            bindparam("cursor_id", type_=model.id.type),
+        )
+    )
+    return first_page, after_cursor
+
+
+# Hot statements built once so every request reuses the same cached plan
+_STMT_LIST_ACCOUNTS = _keyset_statements(select(LinkedInAccount), LinkedInAccount)
+_STMT_LIST_DATA_SOURCES = _keyset_statements(select(DataSource), DataSource)
+_STMT_LIST_JOBS = _keyset_statements(
+    select(ScraperJob).options(selectinload(ScraperJob.data_source), raiseload("*")),
+    ScraperJob,
+)
+_STMT_GET_JOB = (
+    select(ScraperJob)
+    .options(selectinload(ScraperJob.data_source), raiseload("*"))
+    .where(ScraperJob.id == bindparam("job_id"))
+)
+
+
+async def _keyset_page(db, statements, model, response, limit, cursor, count):
+    """
+    Return one page of a list query built by _keyset_statements.
+
+    Pages are keyed on (created_at, id) so deep pages cost the same as the
+    first. The id to pass as the next `cursor` is sent in X-Next-Cursor, and
+    `count=true` adds the table total in X-Total-Count.
+    """
+    first_page, after_cursor = statements
+    params = {"limit": limit + 1}
+    stmt = first_page
+    if cursor:
+        anchor = await db.get(model, cursor)
+        if not anchor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        params.update(cursor_created_at=anchor.created_at, cursor_id=anchor.id)
+        stmt = after_cursor
+
+    items = (await db.execute(stmt, params)).scalars().all()
+    if len(items) > limit:
+        items = items[:limit]
+        response.headers["X-Next-Cursor"] = str(items[-1].id)
+
+    if count:
+        total = await db.scalar(select(func.count()).select_from(model))
+        response.headers["X-Total-Count"] = str(total)
+    return items
+
 
 # ---------------------------------------------------------------------------
 # LinkedIn Accounts
@@ -49,27 +146,34 @@ async def create_linkedin_account(
         is_sales_navigator=data.is_sales_navigator,
         status=ObjectStatus.ACTIVE,
     )
-    db.add(account)
-    await db.flush()
-    await db.refresh(account)
+    async with db.begin():
+        db.add(account)
     return account
 
 
 @router.get("/linkedin-accounts", response_model=List[LinkedInAccountResponse])
-async def list_linkedin_accounts(db: AsyncSession = Depends(get_db)):
-    """List all connected LinkedIn accounts."""
-    result = await db.execute(select(LinkedInAccount))
-    return result.scalars().all()
+async def list_linkedin_accounts(
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[uuid.UUID] = None,
+    count: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    """List connected LinkedIn accounts, newest first."""
+    return await _keyset_page(
+        db, _STMT_LIST_ACCOUNTS, LinkedInAccount, response, limit, cursor, count
+    )
 
 
 @router.delete("/linkedin-accounts/{account_id}")
 async def delete_linkedin_account(
     account_id: uuid.UUID, db: AsyncSession = Depends(get_db)
 ):
-    account = await db.get(LinkedInAccount, account_id)
-    if not account:
+    result = await db.execute(
+        delete(LinkedInAccount).where(LinkedInAccount.id == account_id)
+    )
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Account not found")
-    await db.delete(account)
     return {"status": "deleted"}
 
 
@@ -78,9 +182,16 @@ async def delete_linkedin_account(
 # ---------------------------------------------------------------------------
 @router.post("/data-sources", response_model=DataSourceResponse)
 async def create_data_source(
-    data: DataSourceCreate, db: AsyncSession = Depends(get_db)
+    data: DataSourceCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
 ):
-    """Create a data source (Google Sheet or manual URL list)."""
+    """
+    Create a data source (Google Sheet or manual URL list).
+
+    Ingestion runs in the background; poll GET /data-sources/{id} until the
+    status leaves "pending".
+    """
     ds = DataSource(
         name=data.name,
         source_type=data.source_type,
@@ -90,103 +201,121 @@ async def create_data_source(
         column_type=data.column_type,
         status=ObjectStatus.PENDING,
     )
-    db.add(ds)
-    await db.flush()
+    async with db.begin():
+        db.add(ds)
 
-    # Ingest data immediately
-    try:
-        await job_orchestrator.ingest_data_source(db, ds.id)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    await db.refresh(ds)
+    background_tasks.add_task(job_orchestrator.ingest_data_source_standalone, ds.id)
     return ds
 
 
 @router.post("/data-sources/upload-csv", response_model=DataSourceResponse)
 async def upload_csv_data_source(
+    background_tasks: BackgroundTasks,
     name: str = Form(...),
     column_name: str = Form(...),
     column_type: str = Form(default="company_name"),
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
 ):
-    """Upload a CSV file as a data source."""
-    import os
-    import tempfile
-
-    # Save uploaded file
+    """Upload a CSV file as a data source. Ingestion runs in the background."""
+    # Stream the upload to disk in 1 MB chunks so memory stays flat
     suffix = os.path.splitext(file.filename)[1] if file.filename else ".csv"
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
-
-    ds = DataSource(
-        name=name,
-        source_type="csv_upload",
-        column_name=column_name,
-        column_type=column_type,
-        raw_data={"file_path": tmp_path, "original_filename": file.filename},
-        status=ObjectStatus.PENDING,
-    )
-    db.add(ds)
-    await db.flush()
-
+    fd, tmp_path = await asyncio.to_thread(tempfile.mkstemp, suffix=suffix)
+    os.close(fd)
     try:
-        await job_orchestrator.ingest_data_source(db, ds.id)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    await db.refresh(ds)
+        async with aiofiles.open(tmp_path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await out.write(chunk)
+
+        ds = DataSource(
+            name=name,
+            source_type="csv_upload",
+            column_name=column_name,
+            column_type=column_type,
+            raw_data={"file_path": tmp_path, "original_filename": file.filename},
+            status=ObjectStatus.PENDING,
+        )
+        async with db.begin():
+            db.add(ds)
+    except Exception:
+        # The background ingest removes the file; without a source it never runs
+        await asyncio.to_thread(os.remove, tmp_path)
+        raise
+
+    background_tasks.add_task(job_orchestrator.ingest_data_source_standalone, ds.id)
     return ds
 
 
 @router.get("/data-sources", response_model=List[DataSourceResponse])
-async def list_data_sources(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(DataSource))
-    return result.scalars().all()
+async def list_data_sources(
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[uuid.UUID] = None,
+    count: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    return await _keyset_page(
+        db, _STMT_LIST_DATA_SOURCES, DataSource, response, limit, cursor, count
+    )
+
+
+@router.get("/data-sources/{ds_id}", response_model=DataSourceResponse)
+async def get_data_source(ds_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    ds = await db.get(DataSource, ds_id)
+    if not ds:
+        raise HTTPException(status_code=404, detail="Data source not found")
+    return ds
 
 
 @router.get("/data-sources/{ds_id}/companies", response_model=List[CompanyResponse])
 async def list_data_source_companies(
-    ds_id: uuid.UUID, db: AsyncSession = Depends(get_db)
+    ds_id: uuid.UUID,
+    limit: int = Query(default=500, ge=1, le=5000),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
+    stmt = (
         select(Company)
-        .options(selectinload(Company.linkedin_profile))
+        .options(selectinload(Company.linkedin_profile), raiseload("*"))
         .where(Company.data_source_id == ds_id)
+        .order_by(Company.row_index, Company.id)
+        .limit(limit)
+        .offset(offset)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
     )
-    companies = result.scalars().all()
-    return [
-        CompanyResponse(
-            id=c.id,
-            name=c.name,
-            original_input=c.original_input,
-            status=c.status,
-            linkedin_url=c.linkedin_profile.linkedin_url if c.linkedin_profile else None,
-            match_confidence=c.linkedin_profile.match_confidence if c.linkedin_profile else None,
-            employee_count=c.linkedin_profile.employee_count if c.linkedin_profile else None,
-        )
-        for c in companies
-    ]
+    rows = [_company_row(c) async for c in await db.stream_scalars(stmt)]
+    return _json_list(_COMPANY_LIST_ADAPTER, rows)
+
+
+def _company_row(company: Company) -> dict:
+    """CompanyResponse fields; LinkedIn fields are None when unresolved."""
+    lp = company.linkedin_profile
+    return {
+        "id": company.id,
+        "name": company.name,
+        "original_input": company.original_input,
+        "status": company.status,
+        "linkedin_url": lp.linkedin_url if lp else None,
+        "match_confidence": lp.match_confidence if lp else None,
+        "employee_count": lp.employee_count if lp else None,
+    }
 
 
 @router.get("/sheets/tabs")
-async def get_google_sheet_tabs(url: str):
-    """Get tabs from a Google Sheet URL."""
+async def get_google_sheet_tabs(url: str, refresh: bool = False):
+    """Get tabs from a Google Sheet URL (refresh=true bypasses the cache)."""
     try:
-        tabs = get_sheet_tabs(url)
+        tabs = await asyncio.to_thread(get_sheet_tabs, url, refresh)
         return {"tabs": tabs}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/sheets/columns")
-async def get_google_sheet_columns(url: str, tab: Optional[str] = None):
-    """Get column headers from a Google Sheet."""
+async def get_google_sheet_columns(url: str, tab: Optional[str] = None, refresh: bool = False):
+    """Get column headers from a Google Sheet (refresh=true bypasses the cache)."""
     try:
-        columns = get_sheet_columns(url, tab)
+        columns = await asyncio.to_thread(get_sheet_columns, url, tab, refresh)
         return {"columns": columns}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -200,22 +329,31 @@ async def create_scraper_job(
     data: ScraperJobCreate, db: AsyncSession = Depends(get_db)
 ):
     """Create a new scraper job configuration."""
-    job = await job_orchestrator.create_scraper_job(db, data)
-    await db.refresh(job)
+    try:
+        async with db.begin():
+            job = await job_orchestrator.create_scraper_job(db, data)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     return job
 
 
 @router.get("/scraper-jobs", response_model=List[ScraperJobResponse])
-async def list_scraper_jobs(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(ScraperJob).options(selectinload(ScraperJob.data_source))
+async def list_scraper_jobs(
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[uuid.UUID] = None,
+    count: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    return await _keyset_page(
+        db, _STMT_LIST_JOBS, ScraperJob, response, limit, cursor, count
     )
-    return result.scalars().all()
 
 
 @router.get("/scraper-jobs/{job_id}", response_model=ScraperJobResponse)
 async def get_scraper_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    job = await db.get(ScraperJob, job_id)
+    result = await db.execute(_STMT_GET_JOB, {"job_id": job_id})
+    job = result.scalar_one_or_none()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
@@ -240,11 +378,25 @@ async def pause_scraper_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/scraper-jobs/{job_id}/counts", response_model=JobCounts)
+async def get_job_counts(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    """Get job result counts only; cheap enough for dashboards to poll."""
+    try:
+        return await job_orchestrator.get_job_counts(db, job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.get("/scraper-jobs/{job_id}/summary", response_model=JobSummary)
-async def get_job_summary(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    """Get a detailed summary of job results."""
+async def get_job_summary(
+    job_id: uuid.UUID,
+    limit: Optional[int] = Query(default=None, ge=1, le=10000),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get a detailed summary of job results; limit/offset page the company lists."""
     try:
-        return await job_orchestrator.get_job_summary(db, job_id)
+        return await job_orchestrator.get_job_summary(db, job_id, limit=limit, offset=offset)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -253,48 +405,72 @@ async def get_job_summary(job_id: uuid.UUID, db: AsyncSession = Depends(get_db))
 async def get_job_employees(
     job_id: uuid.UUID,
     matched_only: bool = False,
+    limit: int = Query(default=500, ge=1, le=5000),
+    offset: int = Query(default=0, ge=0),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get all scraped employees for a job."""
-    job = await db.get(ScraperJob, job_id)
-    if not job:
+    """Get a page of scraped employees for a job."""
+    stmt = _job_employees_query(job_id, matched_only).limit(limit).offset(offset)
+    rows = [dict(row) async for row in (await db.stream(stmt)).mappings()]
+
+    # Only an empty page needs a separate lookup to tell "no employees" from "no job"
+    if not rows and not await db.get(ScraperJob, job_id):
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Get companies -> linkedin profiles -> employees
-    result = await db.execute(
-        select(Employee)
-        .join(CompanyLinkedIn)
-        .join(Company)
-        .options(
-            selectinload(Employee.match_result),
-            selectinload(Employee.company_linkedin),
+    return _json_list(_EMPLOYEE_LIST_ADAPTER, rows)
+
+
+@router.get("/scraper-jobs/{job_id}/employees/export")
+async def export_job_employees(job_id: uuid.UUID, matched_only: bool = False):
+    """Stream every scraped employee for a job as NDJSON."""
+    async with async_session() as db:
+        if not await db.get(ScraperJob, job_id):
+            raise HTTPException(status_code=404, detail="Job not found")
+
+    async def lines():
+        # Own session: the request-scoped one is closed before the body streams
+        async with async_session() as db:
+            result = await db.stream(_job_employees_query(job_id, matched_only))
+            async for rows in result.mappings().partitions(STREAM_BATCH_SIZE):
+                employees = _EMPLOYEE_LIST_ADAPTER.validate_python([dict(row) for row in rows])
+                yield "".join(employee.model_dump_json() + "\n" for employee in employees)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def _job_employees_query(job_id: uuid.UUID, matched_only: bool = False):
+    """
+    Job -> data source companies -> linkedin profiles -> employees, in one query.
+
+    Selects only the EmployeeResponse columns, labelled to match its fields,
+    so rows map straight onto the schema without hydrating ORM objects.
+    """
+    stmt = (
+        select(
+            Employee.id,
+            Employee.full_name,
+            Employee.first_name,
+            Employee.last_name,
+            Employee.job_title,
+            Employee.linkedin_url,
+            Employee.location,
+            Employee.email,
+            CompanyLinkedIn.name_on_linkedin.label("company_name"),
+            MatchResult.is_match,
+            MatchResult.confidence.label("match_confidence"),
+            MatchResult.reasoning.label("match_reasoning"),
         )
-        .where(Company.data_source_id == job.data_source_id)
+        .join(CompanyLinkedIn, Employee.company_linkedin_id == CompanyLinkedIn.id)
+        .join(Company, CompanyLinkedIn.company_id == Company.id)
+        .join(ScraperJob, ScraperJob.data_source_id == Company.data_source_id)
+        .outerjoin(MatchResult, MatchResult.employee_id == Employee.id)
+        .where(ScraperJob.id == job_id)
+        .order_by(Employee.id)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
     )
-    employees = result.scalars().all()
-
-    response = []
-    for emp in employees:
-        mr = emp.match_result
-        if matched_only and (not mr or not mr.is_match):
-            continue
-
-        response.append(EmployeeResponse(
-            id=emp.id,
-            full_name=emp.full_name,
-            first_name=emp.first_name,
-            last_name=emp.last_name,
-            job_title=emp.job_title,
-            linkedin_url=emp.linkedin_url,
-            location=emp.location,
-            email=emp.email,
-            company_name=emp.company_linkedin.name_on_linkedin if emp.company_linkedin else None,
-            is_match=mr.is_match if mr else None,
-            match_confidence=mr.confidence if mr else None,
-            match_reasoning=mr.reasoning if mr else None,
-        ))
-
-    return response
+    if matched_only:
+        stmt = stmt.where(MatchResult.is_match.is_(True))
+    return stmt
 
 
 # ---------------------------------------------------------------------------
@@ -303,7 +479,13 @@ async def get_job_employees(
 @router.post("/ai/suggest-roles", response_model=RoleMatchSuggestion)
 async def ai_suggest_roles(data: RoleMatchRequest):
     """Use AI to suggest related job titles for targeting."""
-    roles, reasoning = await suggest_related_roles(data.job_titles)
+    try:
+        roles, reasoning = await asyncio.wait_for(
+            suggest_related_roles(data.job_titles),
+            timeout=settings.AI_REQUEST_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="AI role suggestion timed out")
     return RoleMatchSuggestion(suggested_roles=roles, reasoning=reasoning)
 
 
@@ -0,0 +1,60 @@
+"""
+Redis-backed JSON cache for expensive lookups (LLM calls, web searches).
+
+Cache failures are never fatal: a Redis outage just means every lookup is a
+miss and values are recomputed.
+"""
+
+import asyncio
+import json
+import hashlib
+import logging
+import weakref
+from typing import Any, Optional
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# redis.asyncio connections are bound to the loop that opened them, and Celery
+# tasks each run their own loop, so keep one client per running loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, redis.Redis]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client() -> redis.Redis:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = redis.from_url(settings.REDIS_URL)
+        _clients[loop] = client
+    return client
+
+
+def make_key(prefix: str, *parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable parts."""
+    digest = hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+async def get_json(key: str) -> Optional[Any]:
+    """Return the cached value for key, or None on a miss or Redis error."""
+    try:
+        raw = await _get_client().get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+async def set_json(key: str, value: Any, ttl_seconds: int) -> None:
+    """Store value under key for ttl_seconds, ignoring Redis errors."""
+    try:
+        await _get_client().set(key, json.dumps(value), ex=ttl_seconds)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
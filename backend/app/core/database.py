@@ -2,14 +2,38 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+
+def _async_database_url(url: str) -> str:
+    """Force the asyncpg driver so queries never fall back to a thread pool."""
+    scheme, sep, rest = url.partition("://")
+    if scheme in ("postgres", "postgresql", "postgresql+psycopg2"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
+
+engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    echo=settings.DEBUG,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=True,
+    connect_args={
+        "server_settings": {"jit": "off"},
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
-    pass
+    # Fetch generated defaults via INSERT ... RETURNING instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
 
 async def get_db() -> AsyncSession:
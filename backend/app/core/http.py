@@ -0,0 +1,138 @@
+"""
+Shared HTTP clients for the LinkedIn and Google scraping calls.
+
+Each host gets one pooled httpx.AsyncClient, so successive requests (every
+page of an employee search, every company in a job) reuse open TLS
+connections instead of handshaking per request. LinkedIn requests also go
+through a per-account rate limiter that backs off when LinkedIn throttles.
+"""
+
+import asyncio
+import random
+import weakref
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict
+
+import httpx
+
+from app.core.config import settings
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+_TIMEOUTS = {
+    "linkedin": httpx.Timeout(15.0, connect=5.0),
+    "google": httpx.Timeout(10.0, connect=5.0),
+}
+
+# httpx clients are bound to the loop that opened their connections, and
+# Celery tasks each run their own loop, so keep one set of clients per loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client(host: str) -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    clients = _clients.setdefault(loop, {})
+    client = clients.get(host)
+    if client is None:
+        client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=_TIMEOUTS[host],
+            limits=_LIMITS,
+            # Requests carry their own account cookies; never keep ones set
+            # by a response, or they would leak into other accounts' requests
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        clients[host] = client
+    return client
+
+
+def get_linkedin_client() -> httpx.AsyncClient:
+    """Return the pooled client for linkedin.com requests."""
+    return _get_client("linkedin")
+
+
+def get_google_client() -> httpx.AsyncClient:
+    """Return the pooled client for google.com requests."""
+    return _get_client("google")
+
+
+async def close_http_clients() -> None:
+    """Close the clients opened on the running loop (call before it closes)."""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+class AdaptiveRateLimiter:
+    """
+    Spaces calls to at most rate_per_minute, with jitter so the spacing isn't
+    mechanical. A throttled response halves the rate and pauses for the
+    server's Retry-After; each success then steps the rate back up.
+    """
+
+    def __init__(self, rate_per_minute: float, min_rate_per_minute: float = 1.0):
+        self.max_rate = rate_per_minute
+        self.min_rate = min(min_rate_per_minute, rate_per_minute)
+        self.rate = rate_per_minute
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Holding the lock while sleeping queues callers in arrival order
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            interval = 60.0 / self.rate
+            self._next_at = loop.time() + interval * random.uniform(0.75, 1.25)
+
+    def throttled(self, retry_after: float) -> None:
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._next_at = max(self._next_at, asyncio.get_running_loop().time() + retry_after)
+
+    def succeeded(self) -> None:
+        self.rate = min(self.max_rate, self.rate + 1)
+
+
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AdaptiveRateLimiter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_limiter(account_key: str) -> AdaptiveRateLimiter:
+    limiters = _limiters.setdefault(asyncio.get_running_loop(), {})
+    limiter = limiters.get(account_key)
+    if limiter is None:
+        limiter = AdaptiveRateLimiter(settings.LINKEDIN_REQUESTS_PER_MINUTE)
+        limiters[account_key] = limiter
+    return limiter
+
+
+def _retry_after(response: httpx.Response) -> float:
+    try:
+        return max(float(response.headers.get("Retry-After", "")), 0.0)
+    except ValueError:
+        return settings.LINKEDIN_THROTTLE_BACKOFF_SECONDS
+
+
+async def linkedin_get(account_key: str, url: str, **kwargs) -> httpx.Response:
+    """
+    GET a LinkedIn URL under the account's rate limit.
+
+    Concurrent companies in a job share the account (keyed by its li_at
+    cookie), so they share one limiter. 429 responses are waited out and
+    retried; the last response is returned whatever its status.
+    """
+    limiter = _get_limiter(account_key)
+    client = get_linkedin_client()
+    for _ in range(settings.LINKEDIN_MAX_ATTEMPTS):
+        await limiter.acquire()
+        response = await client.get(url, **kwargs)
+        if response.status_code != 429:
+            limiter.succeeded()
+            return response
+        limiter.throttled(_retry_after(response))
+    return response
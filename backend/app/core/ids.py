@@ -0,0 +1,21 @@
+"""
+Time-ordered UUIDs (version 7, RFC 9562) for primary keys.
+
+New rows get ids that sort after existing ones, so inserts append to the
+right-hand edge of the primary-key B-tree instead of landing on random pages.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Return a UUIDv7: 48-bit Unix millisecond timestamp followed by 74 random bits."""
+    value = int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    value |= (time.time_ns() // 1_000_000) << 80
+    value &= ~(0xF << 76)
+    value |= 0x7 << 76  # version
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
@@ -6,7 +6,9 @@ from healthcare clinics and hospitals. Built on a Palantir ontology database.
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.routes import router
 from app.core.config import settings
@@ -19,17 +21,23 @@ app = FastAPI(
         "employee data, and uses AI for role matching."
     ),
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
-# CORS — allow frontend dev server
+# CORS — explicit frontend origins so browsers can cache preflights
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000", "*"],
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count"],
+    max_age=86400,
 )
 
+# Compress the large JSON list responses (employees, companies)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount API routes
 app.include_router(router, prefix="/api/v1")
 
@@ -23,12 +23,13 @@ from datetime import datetime
 from typing import Optional, List
 
 from sqlalchemy import (
-    String, Text, Integer, Float, Boolean, DateTime, ForeignKey, JSON, Enum
+    String, Text, Integer, Float, Boolean, DateTime, ForeignKey, Enum, Index, func, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from app.core.database import Base
+from app.core.ids import uuid7
 from app.core.ontology import ObjectStatus, MatchConfidence
 
 
@@ -39,7 +40,7 @@ from app.core.ontology import ObjectStatus, MatchConfidence
 class LinkedInAccount(Base):
     __tablename__ = "linkedin_accounts"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
     email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     li_at_cookie: Mapped[str] = mapped_column(Text)
@@ -49,12 +50,12 @@ class LinkedInAccount(Base):
         Enum(ObjectStatus, name="object_status", create_constraint=False),
         default=ObjectStatus.ACTIVE,
     )
-    connected_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    last_used_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    connected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_used_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Reverse links
-    scraper_jobs: Mapped[List["ScraperJob"]] = relationship(back_populates="linkedin_account")
+    scraper_jobs: Mapped[List["ScraperJob"]] = relationship(back_populates="linkedin_account", lazy="raise")
 
 
 # ---------------------------------------------------------------------------
@@ -64,7 +65,7 @@ class LinkedInAccount(Base):
 class DataSource(Base):
     __tablename__ = "data_sources"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
     source_type: Mapped[str] = mapped_column(String(50))  # "google_sheet", "csv_upload", "manual"
     google_sheet_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -72,18 +73,24 @@ class DataSource(Base):
     sheet_tab_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     column_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # column with company names or URLs
     column_type: Mapped[str] = mapped_column(String(50), default="company_name")  # "company_name" or "linkedin_url"
-    raw_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # cached sheet data
+    # Cached sheet data / CSV path; only ingestion reads it, so list and detail
+    # queries leave it out (undefer(DataSource.raw_data) to load it).
+    raw_data: Mapped[Optional[dict]] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_raiseload=True
+    )
     row_count: Mapped[int] = mapped_column(Integer, default=0)
     status: Mapped[str] = mapped_column(
         Enum(ObjectStatus, name="object_status", create_constraint=False),
         default=ObjectStatus.PENDING,
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Links
-    companies: Mapped[List["Company"]] = relationship(back_populates="data_source", cascade="all, delete-orphan")
-    scraper_jobs: Mapped[List["ScraperJob"]] = relationship(back_populates="data_source")
+    companies: Mapped[List["Company"]] = relationship(
+        back_populates="data_source", cascade="all, delete-orphan", lazy="raise"
+    )
+    scraper_jobs: Mapped[List["ScraperJob"]] = relationship(back_populates="data_source", lazy="raise")
 
 
 # ---------------------------------------------------------------------------
@@ -92,18 +99,29 @@ class DataSource(Base):
 # ---------------------------------------------------------------------------
 class Company(Base):
     __tablename__ = "companies"
+    __table_args__ = (
+        # Workers look for a source's not-yet-processed companies; keep that
+        # subset in a small index of its own. Enum columns store member names.
+        Index(
+            "ix_companies_pending", "data_source_id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # One company per distinct name within a data source
+        Index("uq_companies_source_canonical", "data_source_id", "canonical_name", unique=True),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    data_source_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("data_sources.id"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    data_source_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("data_sources.id"), index=True)
     name: Mapped[str] = mapped_column(String(500))
     original_input: Mapped[str] = mapped_column(Text)  # exact value from sheet
+    canonical_name: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # casefolded, for dedupe
     row_index: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     status: Mapped[str] = mapped_column(
         Enum(ObjectStatus, name="object_status", create_constraint=False),
         default=ObjectStatus.PENDING,
     )
     search_query_used: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Links
     data_source: Mapped["DataSource"] = relationship(back_populates="companies")
@@ -119,7 +137,7 @@ class Company(Base):
 class CompanyLinkedIn(Base):
     __tablename__ = "company_linkedin_profiles"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     company_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("companies.id"), unique=True)
     linkedin_url: Mapped[str] = mapped_column(Text)
     linkedin_company_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -134,12 +152,16 @@ class CompanyLinkedIn(Base):
         Enum(MatchConfidence, name="match_confidence", create_constraint=False),
         default=MatchConfidence.HIGH,
     )
-    raw_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    scraped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Links
     company: Mapped["Company"] = relationship(back_populates="linkedin_profile")
-    employees: Mapped[List["Employee"]] = relationship(back_populates="company_linkedin", cascade="all, delete-orphan")
+    raw: Mapped[Optional["CompanyLinkedInRaw"]] = relationship(
+        back_populates="company_linkedin", uselist=False, cascade="all, delete-orphan", lazy="raise"
+    )
+    employees: Mapped[List["Employee"]] = relationship(
+        back_populates="company_linkedin", cascade="all, delete-orphan", lazy="raise"
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -148,8 +170,18 @@ class CompanyLinkedIn(Base):
 # ---------------------------------------------------------------------------
 class Employee(Base):
     __tablename__ = "employees"
+    __table_args__ = (
+        # Per-company listings ordered by scrape time; also serves plain
+        # company_linkedin_id lookups, so the column needs no index of its own.
+        Index("ix_employees_company_linkedin_scraped", "company_linkedin_id", "scraped_at"),
+        # A LinkedIn member appears at most once per company profile
+        Index(
+            "uq_employee_company_member", "company_linkedin_id", "linkedin_member_id",
+            unique=True, postgresql_where=text("linkedin_member_id IS NOT NULL"),
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     company_linkedin_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("company_linkedin_profiles.id"))
     full_name: Mapped[str] = mapped_column(String(500))
     first_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -161,14 +193,44 @@ class Employee(Base):
     email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     phone: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     profile_image_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    raw_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    scraped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Links
     company_linkedin: Mapped["CompanyLinkedIn"] = relationship(back_populates="employees")
     match_result: Mapped[Optional["MatchResult"]] = relationship(
         back_populates="employee", uselist=False, cascade="all, delete-orphan"
     )
+    raw: Mapped[Optional["EmployeeRaw"]] = relationship(
+        back_populates="employee", uselist=False, cascade="all, delete-orphan", lazy="raise"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Raw scrape payloads
+# The LinkedIn API responses behind CompanyLinkedIn and Employee rows, kept
+# in side tables so scans of the hot tables don't drag the JSON along.
+# Loaded only on demand.
+# ---------------------------------------------------------------------------
+class CompanyLinkedInRaw(Base):
+    __tablename__ = "company_linkedin_raw"
+
+    company_linkedin_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("company_linkedin_profiles.id", ondelete="CASCADE"), primary_key=True
+    )
+    raw_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+
+    company_linkedin: Mapped["CompanyLinkedIn"] = relationship(back_populates="raw")
+
+
+class EmployeeRaw(Base):
+    __tablename__ = "employee_raw"
+
+    employee_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True
+    )
+    raw_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+
+    employee: Mapped["Employee"] = relationship(back_populates="raw")
 
 
 # ---------------------------------------------------------------------------
@@ -178,9 +240,11 @@ class Employee(Base):
 class MatchResult(Base):
     __tablename__ = "match_results"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employee_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("employees.id"), unique=True)
-    target_roles: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # list of roles we searched for
+    target_roles: Mapped[Optional[dict]] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_raiseload=True
+    )  # list of roles we searched for
     is_match: Mapped[bool] = mapped_column(Boolean, default=False)
     confidence: Mapped[str] = mapped_column(
         Enum(MatchConfidence, name="match_confidence", create_constraint=False),
@@ -189,7 +253,7 @@ class MatchResult(Base):
     reasoning: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # AI explanation
     matched_role: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     score: Mapped[float] = mapped_column(Float, default=0.0)
-    evaluated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    evaluated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Links
     employee: Mapped["Employee"] = relationship(back_populates="match_result")
@@ -201,20 +265,25 @@ class MatchResult(Base):
 # ---------------------------------------------------------------------------
 class Schedule(Base):
     __tablename__ = "schedules"
+    __table_args__ = (
+        # The scheduler polls for active schedules that are due; with this index
+        # an idle poll is one index probe instead of a scan of every schedule
+        Index("ix_schedules_due", "next_run_at", postgresql_where=text("is_active")),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     frequency: Mapped[str] = mapped_column(String(50))  # "once", "daily", "weekly", "monthly"
     times_per_day: Mapped[int] = mapped_column(Integer, default=1)
     preferred_hour_utc: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     day_of_week: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 0=Mon, 6=Sun
     day_of_month: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Reverse links
-    scraper_jobs: Mapped[List["ScraperJob"]] = relationship(back_populates="schedule")
+    scraper_jobs: Mapped[List["ScraperJob"]] = relationship(back_populates="schedule", lazy="raise")
 
 
 # ---------------------------------------------------------------------------
@@ -224,21 +293,25 @@ class Schedule(Base):
 # ---------------------------------------------------------------------------
 class ScraperJob(Base):
     __tablename__ = "scraper_jobs"
+    __table_args__ = (
+        # Containment lookups ("jobs targeting X": target_job_titles @> '["X"]')
+        Index("ix_scraper_jobs_target_titles_gin", "target_job_titles", postgresql_using="gin"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
 
     # Link: uses DataSource
-    data_source_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("data_sources.id"))
+    data_source_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("data_sources.id"), index=True)
     # Link: authenticated_by LinkedInAccount
-    linkedin_account_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("linkedin_accounts.id"))
+    linkedin_account_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("linkedin_accounts.id"), index=True)
     # Link: scheduled_by Schedule
-    schedule_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("schedules.id"), nullable=True)
+    schedule_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("schedules.id"), nullable=True, index=True)
 
     # Behavior configuration
     max_employees_per_company: Mapped[int] = mapped_column(Integer, default=30)
     max_companies_per_launch: Mapped[int] = mapped_column(Integer, default=50)
-    target_job_titles: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # filter list
+    target_job_titles: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # filter list
     use_ai_matching: Mapped[bool] = mapped_column(Boolean, default=True)
     ai_matching_prompt: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -254,11 +327,12 @@ class ScraperJob(Base):
     employees_scraped: Mapped[int] = mapped_column(Integer, default=0)
     last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    last_launched_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    last_launched_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    # Relationships (Link Types)
-    data_source: Mapped["DataSource"] = relationship(back_populates="scraper_jobs")
-    linkedin_account: Mapped["LinkedInAccount"] = relationship(back_populates="scraper_jobs")
-    schedule: Mapped[Optional["Schedule"]] = relationship(back_populates="scraper_jobs")
+    # Relationships (Link Types). Collections and job links never lazy-load:
+    # queries that need them must ask with selectinload()/contains_eager().
+    data_source: Mapped["DataSource"] = relationship(back_populates="scraper_jobs", lazy="raise")
+    linkedin_account: Mapped["LinkedInAccount"] = relationship(back_populates="scraper_jobs", lazy="raise")
+    schedule: Mapped[Optional["Schedule"]] = relationship(back_populates="scraper_jobs", lazy="raise")
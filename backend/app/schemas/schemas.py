@@ -164,12 +164,15 @@ class RoleMatchSuggestion(BaseModel):
 # ---------------------------------------------------------------------------
 # Job Summary / Stats
 # ---------------------------------------------------------------------------
-class JobSummary(BaseModel):
+class JobCounts(BaseModel):
     total_companies: int
     companies_matched: int
     companies_not_found: int
     close_matches: int
     employees_scraped: int
     matching_employees: int
+
+
+class JobSummary(JobCounts):
     companies_with_results: List[CompanySearchResult]
     companies_without_results: List[CompanySearchResult]
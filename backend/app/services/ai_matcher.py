@@ -7,14 +7,28 @@ says "clinic administrator", the AI can suggest related roles like
 "Practice Manager", "Operations Director", "Office Manager", etc.
 """
 
+import asyncio
 import logging
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
+import httpx
+import orjson
+from rapidfuzz import fuzz, process
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+from app.core import cache
 from app.core.config import settings
 from app.core.ontology import MatchConfidence
 
 logger = logging.getLogger(__name__)
 
+# Value -> member lookup for confidences parsed from LLM replies
+_CONF_MAP = {m.value: m for m in MatchConfidence}
+
 
 ROLE_MATCH_SYSTEM_PROMPT = """You are a job title matching assistant for a healthcare B2B sales tool.
 Your job is to determine if an employee's job title matches the target roles that a salesperson is looking for.
@@ -34,6 +48,37 @@ Respond with JSON only:
 }"""
 
 
+ROLE_MATCH_BATCH_SYSTEM_PROMPT = """You are a job title matching assistant for a healthcare B2B sales tool.
+You will receive a numbered list of employee job titles. For each one, determine if it matches
+the target roles that a salesperson is looking for.
+
+Consider:
+- Exact matches (e.g. "Clinic Administrator" matches "Clinic Administrator")
+- Semantic equivalents (e.g. "Practice Manager" matches "Clinic Administrator")
+- Hierarchical matches (e.g. "Director of Operations" is senior to but relevant to "Operations Manager")
+- Industry-specific titles (e.g. "Chief Dental Officer" in a dental clinic is a decision-maker)
+
+Respond with JSON only, one entry per numbered title:
+{
+  "results": [
+    {
+      "index": 1,
+      "is_match": true/false,
+      "confidence": "exact" | "high" | "medium" | "low" | "no_match",
+      "reasoning": "brief explanation",
+      "matched_role": "which target role this matches (or null)"
+    }
+  ]
+}"""
+
+# Titles sent to the LLM per batched request, and the token budget per title
+ROLE_MATCH_BATCH_SIZE = 25
+_BATCH_TOKENS_PER_TITLE = 120
+
+# Default number of LLM requests allowed in flight at once
+AI_CONCURRENCY = 8
+
+
 ROLE_SUGGESTION_PROMPT = """You are a healthcare industry job title expert. Given a set of target roles,
 suggest additional related job titles that might be relevant for B2B outreach in the healthcare/clinic space.
 
@@ -65,7 +110,7 @@ async def evaluate_role_match(
         return False, MatchConfidence.NO_MATCH, "No job title available", None
 
     # First try rule-based matching for speed
-    rule_result = _rule_based_match(employee_title, target_roles)
+    rule_result = _rule_based_match(employee_title, prepare_targets(target_roles))
     if rule_result[0]:  # is_match
         return rule_result
 
@@ -78,11 +123,10 @@ Is this employee's role a match for the target roles?"""
 
     try:
         result = await _call_llm(ROLE_MATCH_SYSTEM_PROMPT, user_message)
-        import json
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         return (
             parsed.get("is_match", False),
-            MatchConfidence(parsed.get("confidence", "no_match")),
+            _CONF_MAP.get(parsed.get("confidence"), MatchConfidence.NO_MATCH),
             parsed.get("reasoning", ""),
             parsed.get("matched_role"),
         )
@@ -91,6 +135,108 @@ Is this employee's role a match for the target roles?"""
         return False, MatchConfidence.NO_MATCH, f"AI evaluation failed: {e}", None
 
 
+async def evaluate_role_matches_batch(
+    titles: List[Optional[str]],
+    target_roles: List[str],
+    custom_prompt: Optional[str] = None,
+    batch_size: int = ROLE_MATCH_BATCH_SIZE,
+) -> List[Tuple[bool, MatchConfidence, str, Optional[str]]]:
+    """
+    Evaluate many job titles against the target roles.
+
+    Titles resolved by the rule-based matcher, or by the bulk fuzzy pass over
+    the remainder, never reach the LLM; the rest are sent batch_size at a
+    time in a single prompt each, so a company's employees cost a handful of
+    round-trips instead of one per title.
+
+    Returns:
+        One (is_match, confidence, reasoning, matched_role) tuple per title,
+        in input order.
+    """
+    results: List[Optional[Tuple[bool, MatchConfidence, str, Optional[str]]]] = [None] * len(titles)
+    pending: List[int] = []
+    prepared = prepare_targets(target_roles)
+
+    for i, title in enumerate(titles):
+        if not title:
+            results[i] = (False, MatchConfidence.NO_MATCH, "No job title available", None)
+            continue
+        rule_result = _rule_based_match(title, prepared)
+        if rule_result[0]:  # is_match
+            results[i] = rule_result
+        else:
+            pending.append(i)
+
+    if pending:
+        fuzzy = rule_match_bulk([titles[i] for i in pending], prepared)
+        unresolved = []
+        for i, verdict in zip(pending, fuzzy):
+            if verdict[0]:
+                results[i] = verdict
+            else:
+                unresolved.append(i)
+        pending = unresolved
+
+    chunks = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+    sem = asyncio.Semaphore(AI_CONCURRENCY)
+
+    async def one(chunk: List[int]):
+        async with sem:
+            return await _evaluate_title_batch(
+                [titles[i] for i in chunk], target_roles, custom_prompt
+            )
+
+    for chunk, verdicts in zip(chunks, await asyncio.gather(*(one(c) for c in chunks))):
+        for i, verdict in zip(chunk, verdicts):
+            results[i] = verdict
+
+    return results
+
+
+async def _evaluate_title_batch(
+    titles: List[str],
+    target_roles: List[str],
+    custom_prompt: Optional[str],
+) -> List[Tuple[bool, MatchConfidence, str, Optional[str]]]:
+    """Ask the LLM for a verdict on each title in one request."""
+    numbered = "\n".join(f"{n}. {title}" for n, title in enumerate(titles, start=1))
+    user_message = f"""Employee job titles:
+{numbered}
+
+Target roles: {target_roles}
+{f'Additional context: {custom_prompt}' if custom_prompt else ''}
+
+Is each employee's role a match for the target roles?"""
+
+    try:
+        result = await _call_llm(
+            ROLE_MATCH_BATCH_SYSTEM_PROMPT,
+            user_message,
+            max_tokens=_BATCH_TOKENS_PER_TITLE * len(titles),
+        )
+        parsed = orjson.loads(result)
+        by_index = {item.get("index"): item for item in parsed.get("results", [])}
+    except Exception as e:
+        logger.error(f"AI batch role matching failed: {e}")
+        return [
+            (False, MatchConfidence.NO_MATCH, f"AI evaluation failed: {e}", None)
+        ] * len(titles)
+
+    verdicts = []
+    for n in range(1, len(titles) + 1):
+        item = by_index.get(n)
+        if item is None:
+            verdicts.append((False, MatchConfidence.NO_MATCH, "AI returned no verdict", None))
+            continue
+        verdicts.append((
+            item.get("is_match", False),
+            _CONF_MAP.get(item.get("confidence"), MatchConfidence.NO_MATCH),
+            item.get("reasoning", ""),
+            item.get("matched_role"),
+        ))
+    return verdicts
+
+
 async def suggest_related_roles(
     target_roles: List[str],
     industry: str = "healthcare",
@@ -101,6 +247,12 @@ async def suggest_related_roles(
     Returns:
         Tuple of (suggested_roles list, reasoning)
     """
+    normalized = sorted({r.strip().lower() for r in target_roles if r.strip()})
+    cache_key = cache.make_key("ai:roles", normalized, industry.strip().lower())
+    cached = await cache.get_json(cache_key)
+    if cached is not None:
+        return cached["suggested_roles"], cached["reasoning"]
+
     user_message = f"""Target roles: {target_roles}
 Industry: {industry}
 
@@ -108,23 +260,110 @@ Suggest additional related job titles that would be relevant for B2B outreach.""
 
     try:
         result = await _call_llm(ROLE_SUGGESTION_PROMPT, user_message)
-        import json
-        parsed = json.loads(result)
-        return parsed.get("suggested_roles", []), parsed.get("reasoning", "")
+        parsed = orjson.loads(result)
+        roles, reasoning = parsed.get("suggested_roles", []), parsed.get("reasoning", "")
     except Exception as e:
         logger.error(f"AI role suggestion failed: {e}")
         return [], f"AI suggestion failed: {e}"
 
+    # Only successful answers are cached so a transient failure can be retried
+    await cache.set_json(
+        cache_key,
+        {"suggested_roles": roles, "reasoning": reasoning},
+        settings.AI_SUGGESTION_CACHE_TTL_SECONDS,
+    )
+    return roles, reasoning
+
+
+# Lowest rapidfuzz score (0-100) for each fuzzy confidence tier, highest
+# first. A fuzzy match is never EXACT; only _match_title assigns that.
+FUZZY_CONFIDENCE_TIERS = (
+    (95, MatchConfidence.HIGH),
+    (80, MatchConfidence.MEDIUM),
+)
+
+# Minimum score for a bulk fuzzy title match: the lowest tier
+FUZZY_MATCH_THRESHOLD = FUZZY_CONFIDENCE_TIERS[-1][0]
+
+# Common filler words ignored when comparing title and role words
+_FILLER = frozenset({"of", "the", "and", "in", "at", "for", "a", "an", "&"})
+
+
+@dataclass(frozen=True)
+class PreparedTargets:
+    """A job's target roles normalized once, kept as parallel tuples."""
+
+    roles: Tuple[str, ...]
+    lowered: Tuple[str, ...]
+    word_sets: Tuple[frozenset, ...]  # role words minus _FILLER
+
+
+@lru_cache(maxsize=256)
+def _prepare_targets(target_roles: Tuple[str, ...]) -> PreparedTargets:
+    lowered = tuple(role.lower().strip() for role in target_roles)
+    return PreparedTargets(
+        roles=target_roles,
+        lowered=lowered,
+        word_sets=tuple(frozenset(role.split()) - _FILLER for role in lowered),
+    )
+
+
+def prepare_targets(target_roles: List[str]) -> PreparedTargets:
+    """Normalize target roles for _rule_based_match; compute once per job."""
+    return _prepare_targets(tuple(target_roles))
+
 
 def _rule_based_match(
-    employee_title: str, target_roles: List[str]
+    employee_title: str, prepared: PreparedTargets
 ) -> Tuple[bool, MatchConfidence, str, Optional[str]]:
     """Fast rule-based matching before falling back to AI."""
-    title_lower = employee_title.lower().strip()
+    if not prepared.roles:
+        return False, MatchConfidence.NO_MATCH, "No target roles", None
+    return _match_title(employee_title.lower().strip(), prepared)
+
 
-    for role in target_roles:
-        role_lower = role.lower().strip()
+def rule_match_bulk(
+    titles: List[str], prepared: PreparedTargets
+) -> List[Tuple[bool, MatchConfidence, str, Optional[str]]]:
+    """
+    Fuzzy-match every title against every target role in one vectorized pass.
+
+    Scores are rapidfuzz token_sort_ratio (0-100), so reordered titles such
+    as "Manager, Operations" still match; token_set_ratio is avoided because
+    it scores any subset ("Manager") as a perfect match. Scores map to
+    confidence via FUZZY_CONFIDENCE_TIERS.
+    """
+    if not titles or not prepared.roles:
+        return [(False, MatchConfidence.NO_MATCH, "No rule-based match found", None)] * len(titles)
+
+    scores = process.cdist(
+        [t.lower().strip() for t in titles],
+        prepared.lowered,
+        scorer=fuzz.token_sort_ratio,
+        workers=-1,
+    )
+    best = scores.argmax(axis=1)
+    top = scores.max(axis=1)
+
+    results = []
+    for role_index, score in zip(best.tolist(), top.tolist()):
+        if score < FUZZY_MATCH_THRESHOLD:
+            results.append((False, MatchConfidence.NO_MATCH, "No rule-based match found", None))
+            continue
+        role = prepared.roles[role_index]
+        confidence = next(c for floor, c in FUZZY_CONFIDENCE_TIERS if score >= floor)
+        results.append((True, confidence, f"Fuzzy title match ({score:.0f}) with '{role}'", role))
+    return results
+
+
+@lru_cache(maxsize=16384)
+def _match_title(
+    title_lower: str, prepared: PreparedTargets
+) -> Tuple[bool, MatchConfidence, str, Optional[str]]:
+    """Rule-based match of a normalized title; titles repeat a lot within a job."""
+    title_words = None
 
+    for role, role_lower, role_words in zip(prepared.roles, prepared.lowered, prepared.word_sets):
         # Exact match
         if title_lower == role_lower:
             return True, MatchConfidence.EXACT, "Exact title match", role
@@ -133,51 +372,83 @@ def _rule_based_match(
         if role_lower in title_lower or title_lower in role_lower:
             return True, MatchConfidence.HIGH, f"Title contains '{role}'", role
 
-        # Word overlap
-        role_words = set(role_lower.split())
-        title_words = set(title_lower.split())
-        overlap = role_words & title_words
-        # Remove common filler words
-        filler = {"of", "the", "and", "in", "at", "for", "a", "an", "&"}
-        meaningful_overlap = overlap - filler
+        # Word overlap, ignoring common filler words. Roles with fewer than
+        # two meaningful words can never overlap enough, so skip tokenizing.
+        if len(role_words) < 2:
+            continue
+        if title_words is None:
+            title_words = frozenset(title_lower.split())
+        meaningful_overlap = set(role_words & title_words)
         if len(meaningful_overlap) >= 2:
             return True, MatchConfidence.MEDIUM, f"Significant word overlap: {meaningful_overlap}", role
 
     return False, MatchConfidence.NO_MATCH, "No rule-based match found", None
 
 
-async def _call_llm(system_prompt: str, user_message: str) -> str:
+# SDK clients hold httpx connection pools bound to the loop that opened them,
+# and Celery tasks each run their own loop, so keep one client per loop.
+_anthropic_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncAnthropic]" = (
+    weakref.WeakKeyDictionary()
+)
+_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _http_client() -> httpx.AsyncClient:
+    """Pooled HTTP client for an LLM SDK; keep-alive sized above AI_CONCURRENCY."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
+def _get_anthropic() -> AsyncAnthropic:
+    loop = asyncio.get_running_loop()
+    client = _anthropic_clients.get(loop)
+    if client is None:
+        client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY, http_client=_http_client())
+        _anthropic_clients[loop] = client
+    return client
+
+
+def _get_openai() -> AsyncOpenAI:
+    loop = asyncio.get_running_loop()
+    client = _openai_clients.get(loop)
+    if client is None:
+        client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=_http_client())
+        _openai_clients[loop] = client
+    return client
+
+
+async def _call_llm(system_prompt: str, user_message: str, max_tokens: int = 500) -> str:
     """Call LLM API (tries Anthropic first, then OpenAI)."""
     if settings.ANTHROPIC_API_KEY:
-        return await _call_anthropic(system_prompt, user_message)
+        return await _call_anthropic(system_prompt, user_message, max_tokens)
     elif settings.OPENAI_API_KEY:
-        return await _call_openai(system_prompt, user_message)
+        return await _call_openai(system_prompt, user_message, max_tokens)
     else:
         raise RuntimeError("No AI API key configured (set ANTHROPIC_API_KEY or OPENAI_API_KEY)")
 
 
-async def _call_anthropic(system_prompt: str, user_message: str) -> str:
+async def _call_anthropic(system_prompt: str, user_message: str, max_tokens: int = 500) -> str:
     """Call Anthropic Claude API."""
-    import anthropic
-
-    client = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    client = _get_anthropic()
     response = await client.messages.create(
         model="claude-sonnet-4-20250514",
-        max_tokens=500,
+        max_tokens=max_tokens,
         system=system_prompt,
         messages=[{"role": "user", "content": user_message}],
     )
     return response.content[0].text
 
 
-async def _call_openai(system_prompt: str, user_message: str) -> str:
+async def _call_openai(system_prompt: str, user_message: str, max_tokens: int = 500) -> str:
     """Call OpenAI API."""
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    client = _get_openai()
     response = await client.chat.completions.create(
         model="gpt-4o-mini",
-        max_tokens=500,
+        max_tokens=max_tokens,
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message},
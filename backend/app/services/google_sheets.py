@@ -5,60 +5,213 @@ Connects to Google Sheets API to read company names/URLs from a user's
 spreadsheet. Supports selecting specific tabs and columns.
 """
 
+import csv
 import re
+import time
 import logging
-from typing import List, Optional, Tuple
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import gspread
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 from google.oauth2.service_account import Credentials
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+_SHEET_ID_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
+_BARE_ID_RE = re.compile(r"^[a-zA-Z0-9-_]{20,}$")
+
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets.readonly",
     "https://www.googleapis.com/auth/drive.readonly",
 ]
 
+# Short-lived cache for tab/header lookups, keyed by sheet ID (so different
+# URLs for the same sheet share entries): key -> (expires_at, value)
+_CACHE_MAX_ENTRIES = 256
+_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+
+# Sheets taller than this are read in row ranges of this many rows
+SHEET_CHUNK_ROWS = 5000
+
+_client: Optional[gspread.Client] = None
+_client_lock = threading.Lock()
+
 
 def _get_gspread_client() -> gspread.Client:
-    """Authenticate with Google Sheets API using service account credentials."""
-    creds = Credentials.from_service_account_file(
-        settings.GOOGLE_CREDENTIALS_JSON, scopes=SCOPES
-    )
-    return gspread.authorize(creds)
+    """
+    Return a shared gspread client authenticated with the service account.
+
+    Reusing one client keeps its HTTP session (and TLS connections) alive and
+    lets the access token be refreshed only when it expires.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            creds = Credentials.from_service_account_file(
+                settings.GOOGLE_CREDENTIALS_JSON, scopes=SCOPES
+            )
+            _client = gspread.authorize(creds)
+        return _client
 
 
+@lru_cache(maxsize=1024)
 def extract_sheet_id(url: str) -> str:
-    """Extract the Google Sheet ID from a URL."""
-    match = re.search(r"/spreadsheets/d/([a-zA-Z0-9-_]+)", url)
+    """Extract the Google Sheet ID from a URL (a bare sheet ID is returned as is)."""
+    if _BARE_ID_RE.match(url):
+        return url
+    match = _SHEET_ID_RE.search(url)
     if not match:
         raise ValueError(f"Could not extract sheet ID from URL: {url}")
     return match.group(1)
 
 
-def get_sheet_tabs(sheet_url: str) -> List[str]:
+def _cached(key: Tuple, loader: Callable[[], Any], refresh: bool = False) -> Any:
+    """
+    Return a fresh cached value for key, or call loader and cache its result.
+
+    refresh=True skips the lookup and replaces whatever is cached.
+    """
+    now = time.monotonic()
+    if not refresh:
+        with _cache_lock:
+            hit = _cache.get(key)
+            if hit and hit[0] > now:
+                return hit[1]
+
+    value = loader()
+    with _cache_lock:
+        if len(_cache) >= _CACHE_MAX_ENTRIES:
+            for stale in [k for k, (expires_at, _) in _cache.items() if expires_at <= now]:
+                del _cache[stale]
+        _cache[key] = (now + settings.SHEETS_CACHE_TTL_SECONDS, value)
+    return value
+
+
+def get_sheet_tabs(sheet_url: str, refresh: bool = False) -> List[str]:
     """Return the list of tab/worksheet names in a Google Sheet."""
+    return list(_cached(
+        ("tabs", extract_sheet_id(sheet_url)),
+        lambda: _fetch_sheet_tabs(sheet_url),
+        refresh,
+    ))
+
+
+def _fetch_sheet_tabs(sheet_url: str) -> List[str]:
     client = _get_gspread_client()
     sheet_id = extract_sheet_id(sheet_url)
-    spreadsheet = client.open_by_key(sheet_id)
-    return [ws.title for ws in spreadsheet.worksheets()]
+    # One metadata request, trimmed to the tab titles
+    metadata = client.http_client.fetch_sheet_metadata(
+        sheet_id, params={"fields": "sheets.properties.title"}
+    )
+    return [sheet["properties"]["title"] for sheet in metadata.get("sheets", [])]
 
 
-def get_sheet_columns(sheet_url: str, tab_name: Optional[str] = None) -> List[str]:
+def get_sheet_columns(
+    sheet_url: str, tab_name: Optional[str] = None, refresh: bool = False
+) -> List[str]:
     """Return column headers from the first row of a sheet tab."""
+    return list(_cached(
+        ("columns", extract_sheet_id(sheet_url), tab_name),
+        lambda: _fetch_sheet_columns(sheet_url, tab_name),
+        refresh,
+    ))
+
+
+def _a1_prefix(tab_name: Optional[str]) -> str:
+    """Sheet prefix for an A1 range; no prefix means the first tab."""
+    if not tab_name:
+        return ""
+    return "'" + tab_name.replace("'", "''") + "'!"
+
+
+def _column_letter(index: int) -> str:
+    """Convert a 1-based column index to its A1 letter (1 -> A, 27 -> AA)."""
+    letters = ""
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def _fetch_sheet_columns(sheet_url: str, tab_name: Optional[str]) -> List[str]:
     client = _get_gspread_client()
     sheet_id = extract_sheet_id(sheet_url)
-    spreadsheet = client.open_by_key(sheet_id)
+    result = client.http_client.values_get(sheet_id, f"{_a1_prefix(tab_name)}1:1")
+    rows = result.get("values", [])
+    return rows[0] if rows else []
+
 
-    if tab_name:
-        worksheet = spreadsheet.worksheet(tab_name)
-    else:
-        worksheet = spreadsheet.sheet1
+def _sheet_row_count(sheet_id: str, tab_name: Optional[str]) -> int:
+    """Return the grid row count of a tab (the first tab if none is named)."""
+    client = _get_gspread_client()
+    metadata = client.http_client.fetch_sheet_metadata(
+        sheet_id, params={"fields": "sheets.properties(title,gridProperties.rowCount)"}
+    )
+    sheets = [s["properties"] for s in metadata.get("sheets", [])]
+    for props in sheets:
+        if not tab_name or props["title"] == tab_name:
+            return props.get("gridProperties", {}).get("rowCount", 0)
+    return 0
 
-    headers = worksheet.row_values(1)
-    return headers
+
+def _read_column_cells(
+    sheet_id: str, tab_name: Optional[str], letter: str, start: int, end: Optional[int]
+) -> List[str]:
+    """Read raw cells of one column from row start to end (or the last row)."""
+    client = _get_gspread_client()
+    stop = f"{letter}{end}" if end else letter
+    result = client.http_client.values_get(
+        sheet_id,
+        f"{_a1_prefix(tab_name)}{letter}{start}:{stop}",
+        params={"majorDimension": "COLUMNS"},
+    )
+    columns = result.get("values", [])
+    return columns[0] if columns else []
+
+
+def _read_column_head(
+    sheet_url: str,
+    column_name: str,
+    tab_name: Optional[str],
+    end: Optional[int],
+) -> Tuple[str, List[str]]:
+    """
+    Locate column_name and read its cells from the header row down to end.
+
+    The header row usually comes from the short-lived header cache filled
+    while the user picked the column; if the cached headers turn out to be
+    stale the lookup is retried once against the live sheet.
+
+    Returns:
+        Tuple of (column letter, cells including the header)
+    """
+    sheet_id = extract_sheet_id(sheet_url)
+
+    for fresh in (False, True):
+        headers = get_sheet_columns(sheet_url, tab_name, refresh=fresh)
+        if column_name not in headers:
+            continue
+
+        letter = _column_letter(headers.index(column_name) + 1)
+        column = _read_column_cells(sheet_id, tab_name, letter, 1, end)
+        # A cached header row can be stale if the sheet was just edited
+        if column and column[0] == column_name:
+            return letter, column
+
+    raise ValueError(
+        f"Column '{column_name}' not found. Available columns: {headers}"
+    )
+
+
+def _clean(cells: List[str]) -> List[str]:
+    return [v for v in map(str.strip, cells) if v]
 
 
 def read_column_values(
@@ -69,42 +222,70 @@ def read_column_values(
     """
     Read all values from a specific column in a Google Sheet.
 
+    With a warm header cache the read is a single values.get of just that
+    column.
+
     Returns:
         Tuple of (values list, total row count)
     """
-    client = _get_gspread_client()
-    sheet_id = extract_sheet_id(sheet_url)
-    spreadsheet = client.open_by_key(sheet_id)
+    _, column = _read_column_head(sheet_url, column_name, tab_name, None)
+    # Skip header row, filter empty values
+    values = _clean(column[1:])
+    return values, len(values)
 
-    if tab_name:
-        worksheet = spreadsheet.worksheet(tab_name)
-    else:
-        worksheet = spreadsheet.sheet1
 
-    headers = worksheet.row_values(1)
-    if column_name not in headers:
-        raise ValueError(
-            f"Column '{column_name}' not found. Available columns: {headers}"
-        )
+def iter_column_values(
+    sheet_url: str,
+    column_name: str,
+    tab_name: Optional[str] = None,
+    chunk_rows: int = SHEET_CHUNK_ROWS,
+) -> Iterator[List[str]]:
+    """
+    Yield the non-empty values of a sheet column in batches of sheet rows.
 
-    col_index = headers.index(column_name) + 1  # gspread is 1-indexed
-    all_values = worksheet.col_values(col_index)
+    Sheets with more than chunk_rows rows are read one row range at a time,
+    so the caller can insert a batch while the next one is still to be
+    fetched, and never holds more than one batch of the response. Smaller
+    sheets come back as a single batch.
+    """
+    sheet_id = extract_sheet_id(sheet_url)
+    row_count = _sheet_row_count(sheet_id, tab_name)
+    if row_count <= chunk_rows:
+        yield read_column_values(sheet_url, column_name, tab_name)[0]
+        return
 
-    # Skip header row, filter empty values
-    values = [v.strip() for v in all_values[1:] if v.strip()]
-    return values, len(values)
+    letter, column = _read_column_head(sheet_url, column_name, tab_name, chunk_rows)
+    yield _clean(column[1:])
+    for start in range(chunk_rows + 1, row_count + 1, chunk_rows):
+        end = min(start + chunk_rows - 1, row_count)
+        yield _clean(_read_column_cells(sheet_id, tab_name, letter, start, end))
 
 
 def read_csv_column(file_path: str, column_name: str) -> Tuple[List[str], int]:
-    """Read values from a specific column in a CSV file."""
-    import pandas as pd
+    """
+    Read values from a specific column in a CSV file.
 
-    df = pd.read_csv(file_path)
-    if column_name not in df.columns:
+    Only that column is converted, by pyarrow's multi-threaded reader, and
+    trimming and filtering happen on the Arrow array before any Python
+    strings are created.
+    """
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        columns = next(csv.reader(f), [])
+    if column_name not in columns:
         raise ValueError(
-            f"Column '{column_name}' not found. Available columns: {list(df.columns)}"
+            f"Column '{column_name}' not found. Available columns: {columns}"
         )
 
-    values = df[column_name].dropna().astype(str).str.strip().tolist()
-    values = [v for v in values if v]
+    table = pacsv.read_csv(
+        file_path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=[column_name],
+            column_types={column_name: pa.string()},
+            strings_can_be_null=True,
+        ),
+    )
+    stripped = pc.utf8_trim_whitespace(table.column(column_name))
+    # Nulls (blank / NA cells) and whitespace-only cells both drop out here
+    values = pc.filter(stripped, pc.greater(pc.utf8_length(stripped), 0)).to_pylist()
     return values, len(values)
@@ -6,29 +6,35 @@ This is the Action layer in the Palantir ontology — it validates state
 transitions and dispatches work to the task queue.
 """
 
+import asyncio
+import os
 import uuid
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import undefer
 
+from app.core.bulk import bulk_insert
+from app.core.database import async_session
 from app.models.ontology import (
     ScraperJob, DataSource, Company, CompanyLinkedIn,
     LinkedInAccount, Schedule, Employee, MatchResult,
 )
-from app.core.ontology import ObjectStatus, ActionTypeEnum
+from app.core.ontology import ObjectStatus, ActionTypeEnum, MatchConfidence
 from app.schemas.schemas import (
     ScraperJobCreate, ScraperJobResponse, ScraperJobLaunchResponse,
-    JobSummary, CompanySearchResult,
+    JobCounts, JobSummary, CompanySearchResult,
 )
-from app.services.google_sheets import read_column_values, read_csv_column
+from app.services.google_sheets import iter_column_values, read_csv_column
 from app.tasks.scraper_tasks import run_scraper_job
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_BATCH_SIZE = 1000
+
 
 async def create_scraper_job(
     db: AsyncSession, job_data: ScraperJobCreate
@@ -39,22 +45,26 @@ async def create_scraper_job(
     Creates a new scraper job, linking it to a data source, LinkedIn account,
     and optionally a schedule.
     """
+    data_source = await db.get(DataSource, job_data.data_source_id)
+    if not data_source:
+        raise ValueError(f"DataSource {job_data.data_source_id} not found")
+
     # Create schedule if not one-off
     schedule = None
     if job_data.schedule_frequency != "once":
         schedule = Schedule(
             frequency=job_data.schedule_frequency,
             times_per_day=job_data.schedule_times_per_day,
-            next_run_at=datetime.utcnow() + timedelta(hours=1),
+            next_run_at=datetime.now(timezone.utc) + timedelta(hours=1),
         )
-        db.add(schedule)
-        await db.flush()
 
+    # Assigning the related objects lets one flush insert the schedule and job
+    # together, and leaves job.data_source loaded for the response.
     job = ScraperJob(
         name=job_data.name,
-        data_source_id=job_data.data_source_id,
+        data_source=data_source,
         linkedin_account_id=job_data.linkedin_account_id,
-        schedule_id=schedule.id if schedule else None,
+        schedule=schedule,
         max_employees_per_company=job_data.max_employees_per_company,
         max_companies_per_launch=job_data.max_companies_per_launch,
         target_job_titles=job_data.target_job_titles,
@@ -73,45 +83,100 @@ async def ingest_data_source(db: AsyncSession, data_source_id: uuid.UUID) -> Dat
 
     Reads companies from the data source (Google Sheet or CSV) and creates
     Company objects in the ontology.
+
+    Every batch is written in the caller's transaction and nothing is
+    committed here, so a failure part-way leaves no companies behind once
+    the caller rolls back.
     """
-    ds = await db.get(DataSource, data_source_id)
+    ds = await db.get(DataSource, data_source_id, options=[undefer(DataSource.raw_data)])
     if not ds:
         raise ValueError(f"DataSource {data_source_id} not found")
 
-    try:
-        if ds.source_type == "google_sheet" and ds.google_sheet_url:
-            values, count = read_column_values(
-                ds.google_sheet_url, ds.column_name, ds.sheet_tab_name
-            )
-        elif ds.source_type == "csv_upload" and ds.raw_data:
-            # For CSV, raw_data stores file path
-            values, count = read_csv_column(ds.raw_data.get("file_path", ""), ds.column_name)
-        elif ds.source_type == "manual" and ds.raw_data:
-            values = ds.raw_data.get("values", [])
-            count = len(values)
-        else:
-            raise ValueError(f"Unsupported data source type: {ds.source_type}")
-
-        # Create Company objects
-        for i, value in enumerate(values):
-            company = Company(
-                data_source_id=ds.id,
-                name=value,
-                original_input=value,
-                row_index=i,
-                status=ObjectStatus.PENDING,
+    if ds.source_type == "google_sheet" and ds.google_sheet_url:
+        # Large sheets arrive in row-range batches, each inserted (but not
+        # committed) before the next is fetched
+        batches = iter_column_values(
+            ds.google_sheet_url, ds.column_name, ds.sheet_tab_name
+        )
+    elif ds.source_type == "csv_upload" and ds.raw_data:
+        # For CSV, raw_data stores file path
+        file_path = ds.raw_data.get("file_path", "")
+        try:
+            values, _ = await asyncio.to_thread(
+                read_csv_column, file_path, ds.column_name
             )
-            db.add(company)
+        finally:
+            # The upload is only read once; don't leave it behind on disk
+            if file_path and os.path.exists(file_path):
+                os.remove(file_path)
+        batches = iter([values])
+    elif ds.source_type == "manual" and ds.raw_data:
+        batches = iter([ds.raw_data.get("values", [])])
+    else:
+        raise ValueError(f"Unsupported data source type: {ds.source_type}")
+
+    # Create one Company per distinct name, keeping the first row it
+    # appears on; repeats would each cost a full search and scrape
+    count = 0
+    created = 0
+    seen = set()
+    while (values := await asyncio.to_thread(next, batches, None)) is not None:
+        rows = []
+        for i, value in enumerate(values, start=count):
+            value = value.strip()
+            canonical = value.casefold()
+            if not value or canonical in seen:
+                continue
+            seen.add(canonical)
+            rows.append({
+                "data_source_id": ds.id,
+                "name": value,
+                "original_input": value,
+                "canonical_name": canonical,
+                "row_index": i,
+                "status": ObjectStatus.PENDING,
+            })
+        count += len(values)
+        created += len(rows)
+
+        # COPY for large batches, multi-row INSERTs otherwise; both stay in
+        # the session transaction, so all batches commit or roll back together
+        await bulk_insert(db, Company, rows)
+
+    if created < count:
+        logger.info(f"DataSource {ds.id}: skipped {count - created} duplicate or blank rows")
+
+    ds.row_count = count
+    ds.status = ObjectStatus.COMPLETED
+    await db.flush()
+    return ds
 
-        ds.row_count = count
-        ds.status = ObjectStatus.COMPLETED
-        await db.flush()
-        return ds
 
-    except Exception as e:
-        ds.status = ObjectStatus.FAILED
-        await db.flush()
-        raise
+async def ingest_data_source_standalone(data_source_id: uuid.UUID) -> None:
+    """
+    Run CONNECT_DATA_SOURCE outside the request that created the source.
+
+    Opens its own session so the HTTP response can return while the sheet
+    or CSV is still being read. Failures are recorded on the DataSource
+    status rather than raised.
+    """
+    async with async_session() as db:
+        try:
+            await ingest_data_source(db, data_source_id)
+            await db.commit()
+            return
+        except Exception:
+            logger.exception(f"Ingestion failed for data source {data_source_id}")
+            await db.rollback()
+
+        # The failed transaction is gone; record the failure in a fresh one
+        try:
+            ds = await db.get(DataSource, data_source_id)
+            if ds:
+                ds.status = ObjectStatus.FAILED
+                await db.commit()
+        except Exception:
+            logger.exception(f"Could not mark data source {data_source_id} as failed")
 
 
 async def launch_job(db: AsyncSession, job_id: uuid.UUID) -> ScraperJobLaunchResponse:
@@ -135,8 +200,8 @@ async def launch_job(db: AsyncSession, job_id: uuid.UUID) -> ScraperJobLaunchRes
     job.status = ObjectStatus.PENDING
     await db.flush()
 
-    # Dispatch to Celery
-    task = run_scraper_job.delay(str(job.id))
+    # Dispatch to Celery (publishing to the broker is blocking I/O)
+    task = await asyncio.to_thread(run_scraper_job.delay, str(job.id))
 
     return ScraperJobLaunchResponse(
         job_id=job.id,
@@ -157,61 +222,115 @@ async def pause_job(db: AsyncSession, job_id: uuid.UUID) -> ScraperJob:
     return job
 
 
-async def get_job_summary(db: AsyncSession, job_id: uuid.UUID) -> JobSummary:
-    """Get a summary of a scraper job's results."""
+async def get_job_counts(db: AsyncSession, job_id: uuid.UUID) -> JobCounts:
+    """Get a scraper job's result counts without listing its companies."""
+    job = await db.get(ScraperJob, job_id)
+    if not job:
+        raise ValueError(f"Job {job_id} not found")
+    return await _job_counts(db, job)
+
+
+async def _job_counts(db: AsyncSession, job: ScraperJob) -> JobCounts:
+    # Company totals in one aggregate over the source's companies
+    total, matched, close_matches = (await db.execute(
+        select(
+            func.count(),
+            func.count(CompanyLinkedIn.id),
+            func.count().filter(
+                CompanyLinkedIn.match_confidence.in_([MatchConfidence.MEDIUM, MatchConfidence.LOW])
+            ),
+        )
+        .select_from(Company)
+        .outerjoin(CompanyLinkedIn, CompanyLinkedIn.company_id == Company.id)
+        .where(Company.data_source_id == job.data_source_id)
+    )).one()
+
+    # Count matching employees among this job's companies
+    matching_employees = 0
+    if job.use_ai_matching:
+        matching_employees = await db.scalar(
+            select(func.count())
+            .select_from(MatchResult)
+            .join(Employee, MatchResult.employee_id == Employee.id)
+            .join(CompanyLinkedIn, Employee.company_linkedin_id == CompanyLinkedIn.id)
+            .join(Company, CompanyLinkedIn.company_id == Company.id)
+            .where(
+                Company.data_source_id == job.data_source_id,
+                MatchResult.is_match.is_(True),
+            )
+        )
+
+    return JobCounts(
+        total_companies=total,
+        companies_matched=matched,
+        companies_not_found=total - matched,
+        close_matches=close_matches,
+        employees_scraped=job.employees_scraped,
+        matching_employees=matching_employees,
+    )
+
+
+async def get_job_summary(
+    db: AsyncSession,
+    job_id: uuid.UUID,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> JobSummary:
+    """
+    Get a summary of a scraper job's results.
+
+    Counts always cover the whole job; limit/offset page through the
+    companies (in sheet order) that are listed alongside them.
+    """
     job = await db.get(ScraperJob, job_id)
     if not job:
         raise ValueError(f"Job {job_id} not found")
 
-    # Get all companies for this job's data source
-    result = await db.execute(
-        select(Company)
-        .options(selectinload(Company.linkedin_profile))
+    counts = await _job_counts(db, job)
+
+    # One projected pass over the job's companies and their LinkedIn
+    # profiles; no ORM objects are built for the rows
+    stmt = (
+        select(
+            Company.name,
+            Company.status,
+            CompanyLinkedIn.id.label("profile_id"),
+            CompanyLinkedIn.linkedin_url,
+            CompanyLinkedIn.match_confidence,
+            CompanyLinkedIn.name_on_linkedin,
+        )
+        .outerjoin(CompanyLinkedIn, CompanyLinkedIn.company_id == Company.id)
         .where(Company.data_source_id == job.data_source_id)
+        .order_by(Company.row_index, Company.id)
+        .offset(offset)
+        .limit(limit)
+        .execution_options(yield_per=SUMMARY_BATCH_SIZE)
     )
-    companies = result.scalars().all()
 
     with_results = []
     without_results = []
-    close_matches = 0
 
-    for company in companies:
-        lp = company.linkedin_profile
-        if lp:
+    result = await db.stream(stmt)
+    async for row in result:
+        if row.profile_id is not None:
             with_results.append(CompanySearchResult(
-                company_name=company.name,
-                linkedin_url=lp.linkedin_url,
-                match_confidence=lp.match_confidence,
-                name_on_linkedin=lp.name_on_linkedin,
-                status=company.status,
+                company_name=row.name,
+                linkedin_url=row.linkedin_url,
+                match_confidence=row.match_confidence,
+                name_on_linkedin=row.name_on_linkedin,
+                status=row.status,
             ))
-            if lp.match_confidence in (MatchConfidence.MEDIUM, MatchConfidence.LOW):
-                close_matches += 1
         else:
             without_results.append(CompanySearchResult(
-                company_name=company.name,
+                company_name=row.name,
                 linkedin_url=None,
                 match_confidence="no_match",
                 name_on_linkedin=None,
-                status=company.status,
+                status=row.status,
             ))
 
-    # Count matching employees
-    matching_employees = 0
-    if job.use_ai_matching:
-        result = await db.execute(
-            select(MatchResult)
-            .where(MatchResult.is_match == True)
-        )
-        matching_employees = len(result.scalars().all())
-
     return JobSummary(
-        total_companies=len(companies),
-        companies_matched=len(with_results),
-        companies_not_found=len(without_results),
-        close_matches=close_matches,
-        employees_scraped=job.employees_scraped,
-        matching_employees=matching_employees,
+        **counts.model_dump(),
         companies_with_results=with_results,
         companies_without_results=without_results,
     )
@@ -8,14 +8,17 @@ Given a LinkedIn company URL, scrapes:
 Uses LinkedIn cookies (Sales Navigator) for authenticated access.
 """
 
-import asyncio
 import logging
 import random
-from typing import Optional, List, Dict, Any
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Mapping
 
 import httpx
+import orjson
 
-from app.core.config import settings
+from app.core.http import linkedin_get
 from app.core.ontology import MatchConfidence
 
 logger = logging.getLogger(__name__)
@@ -25,9 +28,20 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 ]
 
+COMPANY_SLUG_RE = re.compile(r"/company/([^/?#]+)")
+MEMBER_URN_RE = re.compile(r"member:([^,)]+)")
 
-def _build_headers(li_at_cookie: str, jsessionid_cookie: Optional[str] = None) -> dict:
-    """Build authenticated headers for LinkedIn API requests."""
+
+@lru_cache(maxsize=32)
+def _build_headers(
+    li_at_cookie: str, jsessionid_cookie: Optional[str] = None
+) -> Mapping[str, str]:
+    """
+    Build authenticated headers for LinkedIn API requests.
+
+    Built once per account and reused, so each account keeps presenting the
+    same User-Agent instead of switching browsers from one request to the next.
+    """
     headers = {
         "User-Agent": random.choice(USER_AGENTS),
         "Accept": "application/vnd.linkedin.normalized+json+2.1",
@@ -38,22 +52,14 @@ def _build_headers(li_at_cookie: str, jsessionid_cookie: Optional[str] = None) -
     if jsessionid_cookie:
         headers["Cookie"] += f"; JSESSIONID={jsessionid_cookie}"
         headers["csrf-token"] = jsessionid_cookie
-    return headers
-
-
-async def _random_delay():
-    delay = random.uniform(
-        settings.SCRAPE_DELAY_MIN_SECONDS, settings.SCRAPE_DELAY_MAX_SECONDS
-    )
-    await asyncio.sleep(delay)
+    return MappingProxyType(headers)
 
 
 def _extract_company_slug(url: str) -> str:
     """Extract company slug or ID from LinkedIn URL."""
-    url = url.rstrip("/")
-    parts = url.split("/company/")
-    if len(parts) > 1:
-        return parts[1].split("/")[0].split("?")[0]
+    match = COMPANY_SLUG_RE.search(url)
+    if match:
+        return match.group(1)
     raise ValueError(f"Invalid LinkedIn company URL: {url}")
 
 
@@ -73,22 +79,20 @@ async def scrape_company_profile(
 
     headers = _build_headers(li_at_cookie, jsessionid_cookie)
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=15) as client:
-        await _random_delay()
-        try:
-            response = await client.get(api_url, headers=headers)
-            if response.status_code == 404:
-                logger.warning(f"Company not found on LinkedIn: {slug}")
-                return None
-            if response.status_code == 401:
-                logger.error("LinkedIn auth failed — check cookies")
-                return None
-            response.raise_for_status()
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to scrape company {slug}: {e}")
+    try:
+        response = await linkedin_get(li_at_cookie, api_url, headers=headers)
+        if response.status_code == 404:
+            logger.warning(f"Company not found on LinkedIn: {slug}")
             return None
+        if response.status_code == 401:
+            logger.error("LinkedIn auth failed — check cookies")
+            return None
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to scrape company {slug}: {e}")
+        return None
 
-    data = response.json()
+    data = orjson.loads(response.content)
 
     try:
         elements = data.get("elements", [])
@@ -175,19 +179,17 @@ async def scrape_company_employees(
             f"{keywords_filter}"
         )
 
-        async with httpx.AsyncClient(follow_redirects=True, timeout=15) as client:
-            await _random_delay()
-            try:
-                response = await client.get(api_url, headers=headers)
-                if response.status_code in (401, 403):
-                    logger.error("LinkedIn auth failed during employee scraping")
-                    break
-                response.raise_for_status()
-            except httpx.HTTPError as e:
-                logger.error(f"Employee scraping failed for {slug}: {e}")
+        try:
+            response = await linkedin_get(li_at_cookie, api_url, headers=headers)
+            if response.status_code in (401, 403):
+                logger.error("LinkedIn auth failed during employee scraping")
                 break
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Employee scraping failed for {slug}: {e}")
+            break
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         try:
             elements = data.get("data", {}).get("elements", [])
@@ -202,24 +204,7 @@ async def scrape_company_employees(
                 if len(employees) >= max_employees:
                     break
 
-                title = person.get("title", {}).get("text", "") or ""
-                name = person.get("title", {}).get("text", "") or ""
-
-                # Parse from snippetText or headline
-                headline = person.get("headline", {}).get("text", "") or ""
-
-                employee = {
-                    "full_name": _extract_name(person),
-                    "first_name": _extract_first_name(person),
-                    "last_name": _extract_last_name(person),
-                    "job_title": headline,
-                    "linkedin_url": _extract_profile_url(person),
-                    "linkedin_member_id": _extract_member_id(person),
-                    "location": person.get("subline", {}).get("text", ""),
-                    "profile_image_url": _extract_profile_image(person),
-                    "raw_data": person,
-                }
-                employees.append(employee)
+                employees.append(_parse_person(person))
 
         except (KeyError, TypeError, IndexError) as e:
             logger.error(f"Failed to parse employee data: {e}")
@@ -234,48 +219,38 @@ async def scrape_company_employees(
     return employees
 
 
-def _extract_name(person: dict) -> str:
+def _parse_person(person: dict) -> Dict[str, Any]:
+    """Turn one people-search result into Employee fields in a single pass."""
     title = person.get("title", {})
     if isinstance(title, dict):
-        return title.get("text", "Unknown")
-    return str(title) if title else "Unknown"
-
-
-def _extract_first_name(person: dict) -> Optional[str]:
-    name = _extract_name(person)
-    parts = name.split(" ", 1)
-    return parts[0] if parts else None
+        full_name = title.get("text", "Unknown")
+    else:
+        full_name = str(title) if title else "Unknown"
+    first_name, _, last_name = full_name.partition(" ")
 
-
-def _extract_last_name(person: dict) -> Optional[str]:
-    name = _extract_name(person)
-    parts = name.split(" ", 1)
-    return parts[1] if len(parts) > 1 else None
-
-
-def _extract_profile_url(person: dict) -> Optional[str]:
     nav_url = person.get("navigationUrl", "")
-    if nav_url:
-        return nav_url.split("?")[0]
-    return None
 
-
-def _extract_member_id(person: dict) -> Optional[str]:
     urn = person.get("targetUrn", "") or person.get("objectUrn", "")
-    if urn and "member:" in urn:
-        return urn.split("member:")[-1]
-    return None
-
+    member_match = MEMBER_URN_RE.search(urn) if urn else None
 
-def _extract_profile_image(person: dict) -> Optional[str]:
-    image = person.get("image", {}) or {}
-    attrs = image.get("attributes", []) or []
+    image_url = None
+    attrs = (person.get("image", {}) or {}).get("attributes", []) or []
     if attrs:
-        mini_profile = attrs[0].get("miniProfile", {}) or {}
-        picture = mini_profile.get("picture", {}) or {}
+        picture = (attrs[0].get("miniProfile", {}) or {}).get("picture", {}) or {}
         root_url = picture.get("rootUrl", "")
         artifacts = picture.get("artifacts", []) or []
         if root_url and artifacts:
-            largest = artifacts[-1]
-            return root_url + largest.get("fileIdentifyingUrlPathSegment", "")
-    return None
+            image_url = root_url + artifacts[-1].get("fileIdentifyingUrlPathSegment", "")
+
+    return {
+        "full_name": full_name,
+        "first_name": first_name or None,
+        "last_name": last_name or None,
+        # Parse from snippetText or headline
+        "job_title": person.get("headline", {}).get("text", "") or "",
+        "linkedin_url": nav_url.split("?")[0] if nav_url else None,
+        "linkedin_member_id": member_match.group(1) if member_match else None,
+        "location": person.get("subline", {}).get("text", ""),
+        "profile_image_url": image_url,
+        "raw_data": person,
+    }
@@ -13,17 +13,21 @@ from typing import Optional, Tuple
 from urllib.parse import quote_plus
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
 
+from app.core import cache
 from app.core.config import settings
+from app.core.http import get_google_client, linkedin_get
 from app.core.ontology import MatchConfidence
+from app.services.linkedin_scraper import _build_headers
 
 logger = logging.getLogger(__name__)
 
 # Google search for LinkedIn company pages
 GOOGLE_SEARCH_URL = "https://www.google.com/search"
 LINKEDIN_COMPANY_PATTERN = re.compile(
-    r"https?://(?:www\.)?linkedin\.com/company/([a-zA-Z0-9\-_]+)"
+    r"https?://(?:[a-z]{2,3}\.|www\.)?linkedin\.com/company/([a-zA-Z0-9\-_]+)",
+    re.IGNORECASE,
 )
 
 USER_AGENTS = [
@@ -61,23 +65,21 @@ async def search_google_for_linkedin(
     params = {"q": query, "num": 5}
     headers = {"User-Agent": random.choice(USER_AGENTS)}
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=15) as client:
-        await _random_delay()
-        try:
-            response = await client.get(GOOGLE_SEARCH_URL, params=params, headers=headers)
-            response.raise_for_status()
-        except httpx.HTTPError as e:
-            logger.error(f"Google search failed for '{company_name}': {e}")
-            return None
-
-    soup = BeautifulSoup(response.text, "lxml")
-
-    # Extract LinkedIn URLs from search results
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        match = LINKEDIN_COMPANY_PATTERN.search(href)
-        if match:
-            return f"https://www.linkedin.com/company/{match.group(1)}/"
+    await _random_delay()
+    try:
+        response = await get_google_client().get(
+            GOOGLE_SEARCH_URL, params=params, headers=headers
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error(f"Google search failed for '{company_name}': {e}")
+        return None
+
+    # The first LinkedIn company URL in the page belongs to the top result;
+    # scanning the raw HTML avoids building a DOM just to read hrefs
+    match = LINKEDIN_COMPANY_PATTERN.search(response.text)
+    if match:
+        return f"https://www.linkedin.com/company/{match.group(1)}/"
 
     return None
 
@@ -106,31 +108,19 @@ async def search_linkedin_directly(
         "start": 0,
     }
 
-    headers = {
-        "User-Agent": random.choice(USER_AGENTS),
-        "Accept": "application/vnd.linkedin.normalized+json+2.1",
-        "Cookie": f"li_at={li_at_cookie}",
-        "csrf-token": jsessionid_cookie or "",
-        "x-li-lang": "en_US",
-        "x-restli-protocol-version": "2.0.0",
-    }
+    headers = _build_headers(li_at_cookie, jsessionid_cookie)
 
-    if jsessionid_cookie:
-        headers["Cookie"] += f"; JSESSIONID={jsessionid_cookie}"
-
-    async with httpx.AsyncClient(follow_redirects=True, timeout=15) as client:
-        await _random_delay()
-        try:
-            response = await client.get(search_url, params=params, headers=headers)
-            if response.status_code == 401:
-                logger.error("LinkedIn authentication failed — check cookies")
-                return None
-            response.raise_for_status()
-        except httpx.HTTPError as e:
-            logger.error(f"LinkedIn search failed for '{company_name}': {e}")
+    try:
+        response = await linkedin_get(li_at_cookie, search_url, params=params, headers=headers)
+        if response.status_code == 401:
+            logger.error("LinkedIn authentication failed — check cookies")
             return None
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error(f"LinkedIn search failed for '{company_name}': {e}")
+        return None
 
-    data = response.json()
+    data = orjson.loads(response.content)
 
     # Parse the search results to find company URLs
     try:
@@ -199,6 +189,14 @@ async def find_company_linkedin(
     Returns:
         Tuple of (linkedin_url or None, match_confidence)
     """
+    # Repeat and scheduled jobs look up the same companies again
+    cache_key = cache.make_key(
+        "linkedin:company_url", company_name.strip().lower(), (location or "").strip().lower()
+    )
+    cached = await cache.get_json(cache_key)
+    if cached is not None:
+        return cached["url"], MatchConfidence(cached["confidence"])
+
     # Strategy 1: Google search
     url = await search_google_for_linkedin(company_name, location=location)
 
@@ -209,5 +207,11 @@ async def find_company_linkedin(
     if not url:
         return None, MatchConfidence.NO_MATCH
 
-    # We found a URL — now assess confidence (name comparison done later after scraping)
+    # We found a URL — now assess confidence (name comparison done later after scraping).
+    # Misses aren't cached so a blocked or failed search can be retried.
+    await cache.set_json(
+        cache_key,
+        {"url": url, "confidence": MatchConfidence.HIGH.value},
+        settings.LINKEDIN_LOOKUP_CACHE_TTL_SECONDS,
+    )
     return url, MatchConfidence.HIGH
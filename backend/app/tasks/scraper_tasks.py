@@ -9,28 +9,80 @@ These tasks run asynchronously to:
 import asyncio
 import logging
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from celery import group
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import contains_eager, selectinload
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 from app.tasks.celery_app import celery_app
+from app.core.bulk import bulk_insert
+from app.core.config import settings
+from app.core.database import async_session, engine
+from app.core.http import close_http_clients
+from app.core.ids import uuid7
 from app.core.ontology import ObjectStatus, MatchConfidence
-from app.services.linkedin_search import find_company_linkedin
+from app.services.linkedin_search import find_company_linkedin, _compute_match_confidence
 from app.services.linkedin_scraper import scrape_company_profile, scrape_company_employees
-from app.services.ai_matcher import evaluate_role_match
+from app.services.ai_matcher import evaluate_role_matches_batch
 
 logger = logging.getLogger(__name__)
 
+# MatchResult.score for each role-match confidence; anything lower scores 0.2
+MATCH_SCORES = {
+    MatchConfidence.EXACT: 1.0,
+    MatchConfidence.HIGH: 0.8,
+    MatchConfidence.MEDIUM: 0.5,
+}
+
+# Fixed gaps between runs; "daily" depends on times_per_day, "once" doesn't repeat
+SCHEDULE_INTERVALS = {
+    "weekly": timedelta(weeks=1),
+    "monthly": timedelta(days=30),
+}
+
+# One event loop per worker process, reused by every task it runs. The async
+# engine's pooled connections and the HTTP/LLM/Redis clients are all bound to
+# the loop that opened them, so a loop per task would throw them away each time.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run(coro):
+    """Run a coroutine to completion on this worker process's event loop."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        # uvicorn picks uvloop for the API itself; the worker creates its own loop
+        _loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _reset_engine_pool(**kwargs):
+    """Give each forked worker its own connection pool.
+
+    close=False forgets any connections inherited from the parent instead of
+    closing them, which would end the parent's sessions on the server.
+    """
+    engine.sync_engine.dispose(close=False)
 
-def _get_sync_session():
-    """Get a synchronous database session for Celery tasks."""
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import Session
-    from app.core.config import settings
 
-    engine = create_engine(settings.DATABASE_URL_SYNC)
-    return Session(engine)
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs):
+    """Close pooled clients and DB connections before the worker exits."""
+    if _loop is None or _loop.is_closed():
+        return
+    _loop.run_until_complete(close_http_clients())
+    _loop.run_until_complete(engine.dispose())
+    _loop.close()
 
 
 @celery_app.task(bind=True, name="app.tasks.scraper_tasks.run_scraper_job")
@@ -44,229 +96,308 @@ def run_scraper_job(self, job_id: str):
     5. Run AI role matching
     6. Update stats
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(_run_scraper_job_async(self, job_id))
-    finally:
-        loop.close()
+    _run(_run_scraper_job_async(self, job_id))
 
 
 async def _run_scraper_job_async(task, job_id: str):
     """Async implementation of the scraper job."""
+    from app.models.ontology import ScraperJob
+
+    async with async_session() as session:
+        try:
+            await _process_job(session, task, job_id)
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            try:
+                await session.rollback()
+                job = await session.get(ScraperJob, uuid.UUID(job_id))
+                if job:
+                    job.status = ObjectStatus.FAILED
+                    job.last_error = str(e)
+                    await session.commit()
+            except Exception:
+                pass
+
+
+async def _process_job(session, task, job_id: str):
+    """Run the job's launch batch of companies and record the job's stats."""
     from app.models.ontology import (
-        ScraperJob, Company, CompanyLinkedIn, Employee, MatchResult
+        ScraperJob, Company, CompanyLinkedIn, CompanyLinkedInRaw,
+        Employee, EmployeeRaw, MatchResult,
     )
 
-    session = _get_sync_session()
-
-    try:
-        # Load job with relationships
-        job = session.get(ScraperJob, uuid.UUID(job_id))
-        if not job:
-            logger.error(f"Job {job_id} not found")
-            return
-
-        # Update job status
-        job.status = ObjectStatus.PROCESSING
-        job.last_launched_at = datetime.utcnow()
-        session.commit()
-
-        # Get LinkedIn credentials
-        linkedin_account = job.linkedin_account
-        li_at = linkedin_account.li_at_cookie
-        jsessionid = linkedin_account.jsessionid_cookie
-
-        # Get companies from data source
-        companies = (
-            session.query(Company)
-            .filter(Company.data_source_id == job.data_source_id)
-            .all()
-        )
-
-        total = len(companies)
-        matched = 0
-        not_found = 0
-        employees_scraped = 0
-
-        for i, company in enumerate(companies):
-            if i >= job.max_companies_per_launch:
-                break
-
-            # Update task progress
-            task.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": i + 1,
-                    "total": min(total, job.max_companies_per_launch),
-                    "company": company.name,
-                },
-            )
-
-            try:
-                # Step 1: Find LinkedIn URL
-                if company.status == ObjectStatus.COMPLETED:
-                    # Already processed, skip
-                    continue
-
-                company.status = ObjectStatus.PROCESSING
-                session.commit()
-
-                linkedin_url, confidence = await find_company_linkedin(
-                    company.name,
-                    li_at_cookie=li_at,
-                    jsessionid_cookie=jsessionid,
-                )
-
-                if not linkedin_url:
-                    company.status = ObjectStatus.NOT_FOUND
-                    not_found += 1
-                    session.commit()
-                    continue
-
-                # Step 2: Scrape company profile
-                profile_data = await scrape_company_profile(linkedin_url, li_at, jsessionid)
-
-                company_linkedin = CompanyLinkedIn(
-                    company_id=company.id,
-                    linkedin_url=linkedin_url,
-                    match_confidence=confidence,
-                    **(profile_data or {}),
-                )
-                session.add(company_linkedin)
-                session.flush()
-
-                # Refine confidence based on name comparison
-                if profile_data and profile_data.get("name_on_linkedin"):
-                    from app.services.linkedin_search import _compute_match_confidence
-                    refined = _compute_match_confidence(
-                        company.name, profile_data["name_on_linkedin"]
-                    )
-                    company_linkedin.match_confidence = refined
-
-                company.status = ObjectStatus.COMPLETED
-                matched += 1
-
-                # Step 3: Scrape employees
-                employees = await scrape_company_employees(
-                    linkedin_url,
-                    li_at,
-                    jsessionid,
-                    max_employees=job.max_employees_per_company,
-                    target_titles=job.target_job_titles,
-                )
-
-                for emp_data in employees:
-                    raw = emp_data.pop("raw_data", None)
-                    employee = Employee(
-                        company_linkedin_id=company_linkedin.id,
-                        raw_data=raw,
-                        **emp_data,
+    # Load job with relationships
+    job = await session.get(
+        ScraperJob,
+        uuid.UUID(job_id),
+        options=[selectinload(ScraperJob.linkedin_account)],
+    )
+    if not job:
+        logger.error(f"Job {job_id} not found")
+        return
+
+    # Update job status
+    job.status = ObjectStatus.PROCESSING
+    job.last_launched_at = datetime.now(timezone.utc)
+    await session.commit()
+
+    # Get LinkedIn credentials
+    linkedin_account = job.linkedin_account
+    li_at = linkedin_account.li_at_cookie
+    jsessionid = linkedin_account.jsessionid_cookie
+
+    # Get companies from data source
+    # Only this launch's batch is fetched, in sheet order; the rest are counted
+    total = await session.scalar(
+        select(func.count())
+        .select_from(Company)
+        .where(Company.data_source_id == job.data_source_id)
+    )
+    batch = (await session.execute(
+        select(Company.id, Company.name, Company.status)
+        .where(Company.data_source_id == job.data_source_id)
+        .order_by(Company.row_index, Company.id)
+        .limit(job.max_companies_per_launch)
+    )).all()
+    # Searches and scrapes are network-bound, so a few companies run at once,
+    # each writing through its own session (an AsyncSession can't be shared
+    # between concurrent coroutines)
+    sem = asyncio.Semaphore(settings.SCRAPE_CONCURRENCY)
+
+    async def process_company(row):
+        """Run one company through search, scrape and matching.
+
+        Returns (outcome, employees scraped), outcome being "matched",
+        "not_found" or None.
+        """
+        async with sem:
+            if row.status == ObjectStatus.COMPLETED:
+                # Already processed, skip
+                return None, 0
+
+            async with async_session() as db:
+                company = await db.get(Company, row.id)
+                try:
+                    # Step 1: Find LinkedIn URL
+                    company.status = ObjectStatus.PROCESSING
+                    await db.commit()
+
+                    linkedin_url, confidence = await find_company_linkedin(
+                        company.name,
+                        li_at_cookie=li_at,
+                        jsessionid_cookie=jsessionid,
                     )
-                    session.add(employee)
-                    session.flush()
-
-                    # Step 4: AI role matching (if enabled)
-                    if job.use_ai_matching and job.target_job_titles:
-                        is_match, conf, reasoning, matched_role = await evaluate_role_match(
-                            employee.job_title,
-                            job.target_job_titles,
-                            custom_prompt=job.ai_matching_prompt,
-                        )
-                        match_result = MatchResult(
-                            employee_id=employee.id,
-                            target_roles=job.target_job_titles,
-                            is_match=is_match,
-                            confidence=conf,
-                            reasoning=reasoning,
-                            matched_role=matched_role,
-                            score=1.0 if conf == MatchConfidence.EXACT else 0.8 if conf == MatchConfidence.HIGH else 0.5 if conf == MatchConfidence.MEDIUM else 0.2,
-                        )
-                        session.add(match_result)
 
-                    employees_scraped += 1
+                    if not linkedin_url:
+                        company.status = ObjectStatus.NOT_FOUND
+                        await db.commit()
+                        return "not_found", 0
 
-                session.commit()
+                    # Step 2: Scrape company profile
+                    profile_data = await scrape_company_profile(linkedin_url, li_at, jsessionid)
 
-            except Exception as e:
-                logger.error(f"Error processing company '{company.name}': {e}")
-                company.status = ObjectStatus.FAILED
-                session.commit()
-                continue
+                    # Refine confidence based on name comparison
+                    if profile_data and profile_data.get("name_on_linkedin"):
+                        confidence = _compute_match_confidence(
+                            company.name, profile_data["name_on_linkedin"]
+                        )
 
-        # Update job stats
-        job.companies_processed = min(total, job.max_companies_per_launch)
-        job.companies_matched = matched
-        job.companies_not_found = not_found
-        job.employees_scraped = employees_scraped
-        job.status = ObjectStatus.COMPLETED
-        session.commit()
+                    profile_fields = dict(profile_data or {})
+                    profile_raw = profile_fields.pop("raw_data", None)
 
-        logger.info(
-            f"Job {job_id} completed: {matched}/{total} companies matched, "
-            f"{not_found} not found, {employees_scraped} employees scraped"
-        )
+                    # A re-scrape refreshes the company's existing profile, so
+                    # employees stored by earlier runs stay attached to it
+                    company_linkedin = await db.scalar(
+                        select(CompanyLinkedIn)
+                        .where(CompanyLinkedIn.company_id == company.id)
+                        .options(selectinload(CompanyLinkedIn.raw))
+                    )
+                    if company_linkedin is None:
+                        company_linkedin = CompanyLinkedIn(company_id=company.id)
+                        db.add(company_linkedin)
+                    company_linkedin.linkedin_url = linkedin_url
+                    company_linkedin.match_confidence = confidence
+                    company_linkedin.scraped_at = func.now()
+                    for field, value in profile_fields.items():
+                        setattr(company_linkedin, field, value)
+                    if profile_raw:
+                        company_linkedin.raw = CompanyLinkedInRaw(raw_data=profile_raw)
+                    await db.flush()
+
+                    company.status = ObjectStatus.COMPLETED
+
+                    # Step 3: Scrape employees
+                    employees = await scrape_company_employees(
+                        linkedin_url,
+                        li_at,
+                        jsessionid,
+                        max_employees=job.max_employees_per_company,
+                        target_titles=job.target_job_titles,
+                    )
 
-    except Exception as e:
-        logger.error(f"Job {job_id} failed: {e}")
+                    rows = []
+                    raws = {}
+                    seen_members = set()
+                    for emp_data in employees:
+                        # Search pages can repeat a member; drop repeats here
+                        # rather than sending them to the insert
+                        member_id = emp_data.get("linkedin_member_id")
+                        if member_id:
+                            if member_id in seen_members:
+                                continue
+                            seen_members.add(member_id)
+
+                        raw = emp_data.pop("raw_data", None)
+                        employee_id = uuid7()
+                        rows.append({
+                            "id": employee_id,
+                            "company_linkedin_id": company_linkedin.id,
+                            **emp_data,
+                        })
+                        if raw:
+                            raws[employee_id] = raw
+
+                    # Members already stored for this profile are skipped
+                    # rather than failing the company on uq_employee_company_member
+                    inserted = set()
+                    if rows:
+                        stmt = (
+                            pg_insert(Employee)
+                            .on_conflict_do_nothing(
+                                index_elements=["company_linkedin_id", "linkedin_member_id"],
+                                index_where=Employee.linkedin_member_id.isnot(None),
+                            )
+                            .returning(Employee.id)
+                        )
+                        inserted = set((await db.scalars(stmt, rows)).all())
+                    new_employees = [row for row in rows if row["id"] in inserted]
+
+                    await bulk_insert(db, EmployeeRaw, [
+                        {"employee_id": row["id"], "raw_data": raws[row["id"]]}
+                        for row in new_employees
+                        if row["id"] in raws
+                    ])
+
+                    # Step 4: AI role matching (if enabled), batched per company;
+                    # only newly stored employees are evaluated
+                    if new_employees and job.use_ai_matching and job.target_job_titles:
+                        verdicts = await evaluate_role_matches_batch(
+                            [row.get("job_title") for row in new_employees],
+                            job.target_job_titles,
+                            custom_prompt=job.ai_matching_prompt,
+                        )
+                        await bulk_insert(db, MatchResult, [
+                            {
+                                "employee_id": row["id"],
+                                "target_roles": job.target_job_titles,
+                                "is_match": is_match,
+                                "confidence": conf,
+                                "reasoning": reasoning,
+                                "matched_role": matched_role,
+                                "score": MATCH_SCORES.get(conf, 0.2),
+                            }
+                            for row, (is_match, conf, reasoning, matched_role) in zip(new_employees, verdicts)
+                        ])
+
+                    await db.commit()
+                    return "matched", len(new_employees)
+
+                except Exception as e:
+                    logger.error(f"Error processing company '{row.name}': {e}")
+                    # Drop this company's partial rows, then record the failure
+                    await db.rollback()
+                    company.status = ObjectStatus.FAILED
+                    await db.commit()
+                    return None, 0
+
+    completed = 0
+
+    async def process_and_report(row):
+        """Run process_company, then report how many companies are done."""
+        nonlocal completed
         try:
-            job = session.get(ScraperJob, uuid.UUID(job_id))
-            if job:
-                job.status = ObjectStatus.FAILED
-                job.last_error = str(e)
-                session.commit()
-        except Exception:
-            pass
-    finally:
-        session.close()
+            return await process_company(row)
+        finally:
+            completed += 1
+            # update_state is a blocking write to the result backend
+            await asyncio.to_thread(
+                task.update_state,
+                state="PROGRESS",
+                meta={
+                    "current": completed,
+                    "total": len(batch),
+                    "company": row.name,
+                },
+            )
+
+    outcomes = await asyncio.gather(*(process_and_report(row) for row in batch))
+    matched = sum(1 for outcome, _ in outcomes if outcome == "matched")
+    not_found = sum(1 for outcome, _ in outcomes if outcome == "not_found")
+    employees_scraped = sum(count for _, count in outcomes)
+
+    # Update job stats
+    job.companies_processed = len(batch)
+    job.companies_matched = matched
+    job.companies_not_found = not_found
+    job.employees_scraped = employees_scraped
+    job.status = ObjectStatus.COMPLETED
+    await session.commit()
+
+    logger.info(
+        f"Job {job_id} completed: {matched}/{total} companies matched, "
+        f"{not_found} not found, {employees_scraped} employees scraped"
+    )
 
 
 @celery_app.task(name="app.tasks.scraper_tasks.check_scheduled_jobs")
 def check_scheduled_jobs():
     """Periodic task: check for scheduled jobs that need to run."""
+    _run(_check_scheduled_jobs_async())
+
+
+async def _check_scheduled_jobs_async():
     from app.models.ontology import ScraperJob, Schedule
 
-    session = _get_sync_session()
-    try:
-        now = datetime.utcnow()
-        jobs = (
-            session.query(ScraperJob)
+    async with async_session() as session:
+        now = datetime.now(timezone.utc)
+        # Lock the due schedules so an overlapping check (a slow run, or a
+        # second beat) skips them instead of launching the same jobs again
+        jobs = (await session.scalars(
+            select(ScraperJob)
             .join(Schedule)
-            .filter(
+            .options(contains_eager(ScraperJob.schedule))
+            .where(
                 ScraperJob.is_enabled == True,
                 ScraperJob.status != ObjectStatus.PROCESSING,
                 Schedule.is_active == True,
                 Schedule.next_run_at <= now,
             )
-            .all()
-        )
+            .with_for_update(of=Schedule, skip_locked=True)
+        )).all()
 
         for job in jobs:
-            logger.info(f"Launching scheduled job: {job.name} ({job.id})")
-            run_scraper_job.delay(str(job.id))
-
             # Update next_run_at based on frequency
             schedule = job.schedule
             if schedule:
                 schedule.last_run_at = now
-                _compute_next_run(schedule)
+                _compute_next_run(schedule, now)
 
-        session.commit()
-    finally:
-        session.close()
+        # Advance the schedules before dispatching, so a failed commit can't
+        # leave jobs launched but still due
+        await session.commit()
 
+    if jobs:
+        for job in jobs:
+            logger.info(f"Launching scheduled job: {job.name} ({job.id})")
+        group(run_scraper_job.si(str(job.id)) for job in jobs).apply_async()
 
-def _compute_next_run(schedule):
-    """Compute the next run time for a schedule."""
-    from datetime import timedelta
 
-    now = datetime.utcnow()
+def _compute_next_run(schedule, now: datetime):
+    """Compute the next run time for a schedule, counting from now."""
     if schedule.frequency == "once":
         schedule.is_active = False
         schedule.next_run_at = None
     elif schedule.frequency == "daily":
         schedule.next_run_at = now + timedelta(hours=24 // max(schedule.times_per_day, 1))
-    elif schedule.frequency == "weekly":
-        schedule.next_run_at = now + timedelta(weeks=1)
-    elif schedule.frequency == "monthly":
-        schedule.next_run_at = now + timedelta(days=30)
+    elif schedule.frequency in SCHEDULE_INTERVALS:
+        schedule.next_run_at = now + SCHEDULE_INTERVALS[schedule.frequency]
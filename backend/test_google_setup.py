@@ -92,9 +92,8 @@ def test_sheet_access(sheet_url):
     headers = ws.row_values(1)
     print(f"[OK]   Columns in first tab: {headers}")
 
-    # Count rows
-    all_values = ws.get_all_values()
-    print(f"[OK]   Total rows (including header): {len(all_values)}")
+    # Grid size comes with the worksheet metadata; no need to download cells
+    print(f"[OK]   Rows in tab (including header and blank rows): {ws.row_count}")
 
     print()
     print("  >>> Google Sheets setup is WORKING! <<<")
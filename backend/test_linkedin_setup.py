@@ -19,11 +19,13 @@ def get_cookie():
     li_at = None
 
     if os.path.exists(env_path):
-        with open(env_path) as f:
-            for line in f:
-                if line.startswith("LINKEDIN_LI_AT_COOKIE="):
-                    li_at = line.split("=", 1)[1].strip()
-                    break
+        try:
+            from dotenv import dotenv_values
+        except ImportError:
+            print("[FAIL] python-dotenv not installed. Run: pip install python-dotenv")
+            return None
+        # Parsed the same way the app reads .env (quotes, export, comments)
+        li_at = (dotenv_values(env_path).get("LINKEDIN_LI_AT_COOKIE") or "").strip()
 
     if not li_at:
         print("No li_at cookie found in .env file.")
@@ -5,9 +5,25 @@ const api = axios.create({
   headers: { 'Content-Type': 'application/json' },
 })
 
+// List endpoints return one page at a time and send the cursor for the next
+// page in X-Next-Cursor; follow it so callers get every row.
+const PAGE_SIZE = 500
+
+const getAllPages = async (url) => {
+  const items = []
+  let cursor
+  let res
+  do {
+    res = await api.get(url, { params: { limit: PAGE_SIZE, cursor } })
+    items.push(...res.data)
+    cursor = res.headers['x-next-cursor']
+  } while (cursor)
+  return { ...res, data: items }
+}
+
 // LinkedIn Accounts
 export const createLinkedInAccount = (data) => api.post('/linkedin-accounts', data)
-export const getLinkedInAccounts = () => api.get('/linkedin-accounts')
+export const getLinkedInAccounts = () => getAllPages('/linkedin-accounts')
 export const deleteLinkedInAccount = (id) => api.delete(`/linkedin-accounts/${id}`)
 
 // Data Sources
@@ -16,7 +32,8 @@ export const uploadCsvDataSource = (formData) =>
   api.post('/data-sources/upload-csv', formData, {
     headers: { 'Content-Type': 'multipart/form-data' },
   })
-export const getDataSources = () => api.get('/data-sources')
+export const getDataSources = () => getAllPages('/data-sources')
+export const getDataSource = (id) => api.get(`/data-sources/${id}`)
 export const getDataSourceCompanies = (id) => api.get(`/data-sources/${id}/companies`)
 
 // Google Sheets helpers
@@ -26,11 +43,12 @@ export const getSheetColumns = (url, tab) =>
 
 // Scraper Jobs
 export const createScraperJob = (data) => api.post('/scraper-jobs', data)
-export const getScraperJobs = () => api.get('/scraper-jobs')
+export const getScraperJobs = () => getAllPages('/scraper-jobs')
 export const getScraperJob = (id) => api.get(`/scraper-jobs/${id}`)
 export const launchScraperJob = (id) => api.post(`/scraper-jobs/${id}/launch`)
 export const pauseScraperJob = (id) => api.post(`/scraper-jobs/${id}/pause`)
 export const getJobSummary = (id) => api.get(`/scraper-jobs/${id}/summary`)
+export const getJobCounts = (id) => api.get(`/scraper-jobs/${id}/counts`)
 export const getJobEmployees = (id, matchedOnly = false) =>
   api.get(`/scraper-jobs/${id}/employees`, { params: { matched_only: matchedOnly } })
 